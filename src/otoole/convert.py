@@ -10,6 +10,8 @@ Import the convert function from the otoole package::
 
 import logging
 import os
+from copy import deepcopy
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, Union
 
 import pandas as pd
@@ -223,12 +225,33 @@ def _get_user_config(config) -> dict:
         A dictionary containing the user configuration
     """
     if config:
-        _, ending = os.path.splitext(config)
-        with open(config, "r") as config_file:
-            user_config = _read_file(config_file, ending)
-        logger.info("Reading config from {}".format(config))
-        logger.info("Validating config from {}".format(config))
-        validate_config(user_config)
+        # Strategies add keys to the configuration, so hand out a copy
+        user_config = deepcopy(_read_user_config(config, os.path.getmtime(config)))
+    return user_config
+
+
+@lru_cache(maxsize=8)
+def _read_user_config(config: str, mtime: float) -> dict:
+    """Reads and validates a configuration file, cached on path and modification time
+
+    Arguments
+    ---------
+    config : str
+        Path to config file
+    mtime : float
+        Modification time of the config file, used to invalidate the cache
+
+    Returns
+    -------
+    dict
+        A dictionary containing the user configuration
+    """
+    _, ending = os.path.splitext(config)
+    with open(config, "r") as config_file:
+        user_config = _read_file(config_file, ending)
+    logger.info("Reading config from {}".format(config))
+    logger.info("Validating config from {}".format(config))
+    validate_config(user_config)
     return user_config
 
 
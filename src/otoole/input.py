@@ -42,6 +42,59 @@ from otoole.exceptions import OtooleIndexError, OtooleNameMismatchError
 logger = logging.getLogger(__name__)
 
 
+def _set_index(df: pd.DataFrame, indices: List[str]) -> pd.DataFrame:
+    """Moves the ``indices`` columns of ``df`` into its index
+
+    Equivalent to ``df.set_index(indices)``, but builds the index straight
+    from the column arrays rather than going through the generic key handling.
+    """
+    if len(indices) == 1:
+        index = pd.Index(df[indices[0]], name=indices[0])
+    else:
+        index = pd.MultiIndex.from_arrays(
+            [df[x].to_numpy() for x in indices], names=indices
+        )
+    df = df.drop(columns=indices)
+    df.index = index
+    return df
+
+
+def _cast_indexed(df: pd.DataFrame, dtypes: Dict[str, Any]) -> pd.DataFrame:
+    """Casts an indexed parameter to ``dtypes`` without resetting its index
+
+    Only the unique level values of the index are cast, rather than a full
+    column per index entry. Empty rows are dropped.
+
+    Raises
+    ------
+    ValueError
+        If the index holds missing values, or a level cannot be cast to unique
+        values of the configured dtype
+    """
+    index = df.index
+    if isinstance(index, pd.MultiIndex):
+        if any((codes == -1).any() for codes in index.codes):
+            raise ValueError("Index contains missing values")
+        levels = [
+            level if level.dtype == dtypes[name] else level.astype(dtypes[name])
+            for level, name in zip(index.levels, index.names)
+        ]
+        index = index.set_levels(levels, verify_integrity=True)
+    elif index.hasnans:
+        raise ValueError("Index contains missing values")
+    elif index.dtype != dtypes[index.name]:
+        index = index.astype(dtypes[index.name])
+
+    df = df.set_axis(index, axis=0)
+    df = df[~df.isna().to_numpy().all(axis=1)]
+    columns = {
+        column: dtypes[column]
+        for column in df.columns
+        if column in dtypes and df[column].dtype != dtypes[column]
+    }
+    return df.astype(columns) if columns else df
+
+
 class Context:
     """
     The Context defines the interface of interest to clients.
@@ -426,30 +479,40 @@ class ReadStrategy(Strategy):
 
         if config["type"] == "param":
             logger.debug("Identified {} as a parameter".format(name))
-            try:
-                df.set_index(config["indices"], inplace=True)
-            except KeyError:
+            indices = config["indices"]
+            if list(df.index.names) == indices:
+                # Already indexed, so cast the index levels in place
+                try:
+                    return _cast_indexed(df, config["index_dtypes"])
+                except ValueError:
+                    logger.debug("Unable to cast index levels of {}".format(name))
+            if not set(indices).issubset(df.columns):
                 logger.debug("Unable to set index on {}".format(name))
-                pass
+                df = df.reset_index()
 
             logger.debug("Column dtypes identified: {}".format(config["index_dtypes"]))
             logger.debug(df.head())
-            # Drop empty rows
-            try:
-                df = (
-                    df.dropna(axis=0, how="all")
-                    .reset_index()
-                    .astype(config["index_dtypes"])
-                    .set_index(config["indices"])
-                )
-            except ValueError:  # ValueError: invalid literal for int() with base 10:
-                df = df.dropna(axis=0, how="all").reset_index()
-                for index, dtype in config["index_dtypes"].items():
-                    if dtype == "int64":
-                        df[index] = df[index].astype(float).astype("int64")
-                    else:
-                        df[index] = df[index].astype(dtype)
-                df = df.set_index(config["indices"])
+            # Drop empty rows, i.e. those without any non-index data
+            values = df[[x for x in df.columns if x not in indices]]
+            df = df[~values.isna().to_numpy().all(axis=1)]
+            # Only cast columns whose dtype differs from the configuration
+            dtypes = {
+                column: dtype
+                for column, dtype in config["index_dtypes"].items()
+                if df[column].dtype != dtype
+            }
+            if dtypes:
+                try:
+                    df = df.astype(dtypes)
+                except ValueError:  # invalid literal for int() with base 10:
+                    # Route integer columns through float, e.g. for "2015.0"
+                    via_float = {
+                        index: float
+                        for index, dtype in dtypes.items()
+                        if dtype == "int64"
+                    }
+                    df = df.astype(via_float).astype(dtypes)
+            df = _set_index(df, indices)
 
         else:
             logger.debug("Identified {} as a set".format(name))
@@ -486,13 +549,20 @@ class ReadStrategy(Strategy):
         missing_values = [x for x in all_values if x not in input_data]
 
         for value in missing_values:
-            try:  # param and result condition
-                indices = self.user_config[value]["indices"]
+            details = self.user_config[value]
+            if config_type == "param":
+                dtypes = details["index_dtypes"]
+                df = pd.DataFrame(
+                    {column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()}
+                )
+                df = _set_index(df, details["indices"])
+            elif config_type == "set":
+                df = pd.DataFrame({"VALUE": pd.Series(dtype=details["dtype"])})
+            else:
+                indices = details["indices"]
                 df = pd.DataFrame(columns=indices)
                 df = df.set_index(indices)
-            except KeyError:  # set condition
-                df = pd.DataFrame()
-            df["VALUE"] = ""
+                df["VALUE"] = ""
             input_data[value] = df
 
         return input_data
@@ -581,24 +651,18 @@ class ReadStrategy(Strategy):
     ) -> pd.DataFrame:
         """Creates default dataframe"""
 
-        index_data = {}
         indices = self.user_config[name]["indices"]
-        for index in indices:
-            index_data[index] = input_data[index]["VALUE"].to_list()
+        # The product of individually sorted sets is already lexsorted
+        index_data = [
+            input_data[index]["VALUE"].sort_values().to_numpy() for index in indices
+        ]
 
         if len(index_data) > 1:
-            new_index = pd.MultiIndex.from_product(
-                list(index_data.values()), names=list(index_data.keys())
-            )
+            new_index = pd.MultiIndex.from_product(index_data, names=indices)
         else:
-            new_index = pd.Index(
-                list(index_data.values())[0], name=list(index_data.keys())[0]
-            )
+            new_index = pd.Index(index_data[0], name=indices[0])
 
-        df = pd.DataFrame(index=new_index).sort_index()
-        df["VALUE"] = default_values[name]
-
-        return df
+        return pd.DataFrame({"VALUE": default_values[name]}, index=new_index)
 
     def write_default_params(
         self,
@@ -3,7 +3,6 @@
 import logging
 from typing import Dict
 
-import numpy as np
 import pandas as pd
 
 logger = logging.getLogger()
@@ -51,10 +50,8 @@ def check_datatypes(
     for column in df.columns:
         if column == "VALUE":
             datatype = config_details[parameter]["dtype"]
-            dtypes["VALUE"] = datatype
         else:
             datatype = config_details[column]["dtype"]
-            dtypes[column] = datatype
             logger.debug(f"Found {datatype} for column {column}")
         if df[column].dtype != datatype:
             logger.info(
@@ -63,18 +60,18 @@ def check_datatypes(
                 datatype,
                 parameter,
             )
+            dtypes[column] = datatype
             if datatype == "int":
                 dtypes[column] = "int64"
                 try:
-                    df[column] = df[column].apply(_cast_to_int)
+                    df[column] = df[column].astype(float).astype("int64")
                 except ValueError as ex:
                     msg = "Unable to apply datatype for column {}: {}".format(
                         column, str(ex)
                     )
                     raise ValueError(msg)
 
+    # Only columns that do not already have the configured dtype are cast
+    if not dtypes:
+        return df
     return df.astype(dtypes)
-
-
-def _cast_to_int(value):
-    return np.int64(float(value))
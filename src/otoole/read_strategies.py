@@ -1,10 +1,14 @@
 import logging
 import os
-from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, TextIO, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from amply import Amply
-from flatten_dict import flatten
+from pandas._libs.parsers import STR_NA_VALUES
+from pandas.api.types import is_object_dtype, is_string_dtype
 
 from otoole.exceptions import OtooleDeprecationError, OtooleError
 from otoole.input import ReadStrategy
@@ -14,6 +18,46 @@ from otoole.utils import create_name_mappings
 logger = logging.getLogger(__name__)
 
 
+def _excel_engine() -> str:
+    """Picks the engine used to read Excel workbooks
+
+    python-calamine is used when it is installed and pandas is recent enough
+    (2.2 or later) to recognise it, otherwise openpyxl.
+    """
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return "openpyxl"
+    pandas_version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    if pandas_version < (2, 2):
+        return "openpyxl"
+    return "calamine"
+
+
+EXCEL_ENGINE = _excel_engine()
+
+
+@lru_cache(maxsize=1)
+def _read_excel_sheets(filepath: str, mtime: float) -> Dict[str, pd.DataFrame]:
+    """Reads all sheets of a workbook, cached on path and modification time
+
+    Only the most recently read workbook is kept in memory.
+
+    Arguments
+    ---------
+    filepath: str
+        Path to the Excel workbook
+    mtime: float
+        Modification time of the workbook, used to invalidate the cache
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        Raw sheet data keyed by sheet name
+    """
+    return pd.read_excel(filepath, sheet_name=None, engine=EXCEL_ENGINE)
+
+
 class ReadMemory(ReadStrategy):
     """Read a dict of OSeMOSYS parameters from memory
 
@@ -91,13 +135,9 @@ class _ReadTabular(ReadStrategy):
                         resource=name,
                         message="'VALUE' can not be a header in wide format data",
                     )
-                narrow = pd.melt(
-                    df,
-                    id_vars=converted_headers[:-1],
-                    var_name=converted_headers[-1],  # Normally 'YEAR'
-                    value_name="new_VALUE",
+                narrow = self._reshape_wide_years(
+                    df, converted_headers[:-1], converted_headers[-1]
                 )
-                narrow = narrow.rename(columns={"new_VALUE": "VALUE"})
                 logger.info(f"{name} reshaped from wide to narrow format")
             except IndexError as ex:
                 logger.debug(f"Could not reshape {name}")
@@ -111,23 +151,54 @@ class _ReadTabular(ReadStrategy):
         all_headers = converted_headers + ["VALUE"]
         return narrow[all_headers].set_index(converted_headers)
 
-    def _whitespace_converter(self, indices: List[str]) -> Dict[str, Any]:
-        """Creates converter for striping whitespace in dataframe
+    @staticmethod
+    def _reshape_wide_years(
+        df: pd.DataFrame, id_columns: List[str], year_column: str
+    ) -> pd.DataFrame:
+        """Stacks the year columns of a wide dataframe into one value column
+
+        Produces the same rows, in the same order, as ``pd.melt`` but reshapes
+        the year block as a single array instead of concatenating per column.
+
+        Arguments
+        ---------
+        df: pd.DataFrame
+            Wide data with one column per year
+        id_columns: List[str]
+            Columns that are repeated for each year
+        year_column: str
+            Name of the new column holding the year headers, normally 'YEAR'
+        """
+        years = [x for x in df.columns if x not in id_columns]
+        values = df[years].to_numpy()
+        narrow = {x: np.tile(df[x].to_numpy(), len(years)) for x in id_columns}
+        narrow[year_column] = np.repeat(np.asarray(years), len(df))
+        narrow["VALUE"] = values.ravel(order="F")
+        return pd.DataFrame(narrow)
+
+    def _strip_whitespace(self, df: pd.DataFrame, indices: List[str]) -> pd.DataFrame:
+        """Strips surrounding whitespace from the string columns of a dataframe
 
         Arguments
         ---------
+        df: pd.DataFrame
+            Data as read from file
         indicies: List[str]
-            Column headers of dataframe
+            Column headers of dataframe to strip
 
         Returns
         -------
-        Dict[str,Any]
-            Converter dictionary
+        pd.DataFrame
+            Data with whitespace stripped, unless ``keep_whitespace`` is set
         """
         if self.keep_whitespace:
-            return {}
-        else:
-            return {x: str.strip for x in indices}
+            return df
+        for column in indices:
+            if column in df.columns and (
+                is_object_dtype(df[column]) or is_string_dtype(df[column])
+            ):
+                df[column] = df[column].str.strip()
+        return df
 
 
 class ReadExcel(_ReadTabular):
@@ -149,12 +220,15 @@ class ReadExcel(_ReadTabular):
         default_values = self._read_default_values(config)
         excel_to_csv = create_name_mappings(config, map_full_to_short=False)
 
-        xl = pd.ExcelFile(filepath, engine="openpyxl")
-        self._compare_read_to_expected(names=xl.sheet_names, short_names=True)
+        if isinstance(filepath, str):
+            sheets = _read_excel_sheets(filepath, os.path.getmtime(filepath))
+        else:
+            sheets = pd.read_excel(filepath, sheet_name=None, engine=EXCEL_ENGINE)
+        self._compare_read_to_expected(names=list(sheets), short_names=True)
 
         input_data = {}
 
-        for name in xl.sheet_names:
+        for name, sheet in sheets.items():
 
             try:
                 mod_name = excel_to_csv[name]
@@ -163,7 +237,7 @@ class ReadExcel(_ReadTabular):
 
             config_details = config[mod_name]
 
-            df = xl.parse(name)
+            df = sheet.copy()  # do not modify the cached sheet
 
             entity_type = config[mod_name]["type"]
 
@@ -186,6 +260,21 @@ class ReadExcel(_ReadTabular):
 
         return input_data, default_values
 
+    def _check_index(
+        self, input_data: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Checks index and datatypes, and sorts the parameter indices
+
+        Wide format sheets are melted year by year, so the resulting index is
+        not lexsorted. Sorting once here keeps later lookups and groupbys on
+        the fast path.
+        """
+        input_data = super()._check_index(input_data)
+        for name, df in input_data.items():
+            if self.user_config[name]["type"] == "param":
+                input_data[name] = df.sort_index()
+        return input_data
+
 
 class ReadCsv(_ReadTabular):
     """Read in a folder of CSV files to a dict of Pandas DataFrames
@@ -215,17 +304,27 @@ class ReadCsv(_ReadTabular):
 
         default_values = self._read_default_values(self.user_config)
 
-        for parameter, details in self.user_config.items():
-            logger.info("Looking for %s", parameter)
+        tables = {
+            name: details
+            for name, details in self.user_config.items()
+            if details["type"] in ["param", "set"]
+        }
+
+        # pandas releases the GIL while parsing, so read the files concurrently
+        with ThreadPoolExecutor() as executor:
+            futures = {}
+            for parameter, details in tables.items():
+                logger.info("Looking for %s", parameter)
+                futures[parameter] = executor.submit(
+                    self._get_input_data, filepath, parameter, details
+                )
 
-            entity_type = details["type"]
-            try:
-                converter = self._whitespace_converter(details["indices"])
-            except KeyError:  # sets don't have indices def
-                converter = self._whitespace_converter(["VALUE"])
+        for parameter, details in tables.items():
+            # sets don't have indices def
+            indices = details.get("indices", ["VALUE"])
+            df = self._strip_whitespace(futures[parameter].result(), indices)
 
-            if entity_type == "param":
-                df = self._get_input_data(filepath, parameter, details, converter)
+            if details["type"] == "param":
                 narrow = self._convert_wide_2_narrow(df, parameter)
                 if not narrow.empty:
                     narrow_checked = check_datatypes(
@@ -234,8 +333,7 @@ class ReadCsv(_ReadTabular):
                 else:
                     narrow_checked = narrow
 
-            elif entity_type == "set":
-                df = self._get_input_data(filepath, parameter, details, converter)
+            else:
                 narrow = self._check_set(df, details, parameter)
                 if not narrow.empty:
                     narrow_checked = check_set_datatype(
@@ -244,9 +342,6 @@ class ReadCsv(_ReadTabular):
                 else:
                     narrow_checked = narrow
 
-            else:  # results
-                continue
-
             input_data[parameter] = narrow_checked
 
         for config_type in ["param", "set"]:
@@ -262,9 +357,7 @@ class ReadCsv(_ReadTabular):
         return input_data, default_values
 
     @staticmethod
-    def _get_input_data(
-        filepath: str, parameter: str, details: Dict, converter: Optional[Dict] = None
-    ) -> pd.DataFrame:
+    def _get_input_data(filepath: str, parameter: str, details: Dict) -> pd.DataFrame:
         """Reads in and checks CSV data format.
 
         Arguments
@@ -281,10 +374,33 @@ class ReadCsv(_ReadTabular):
         pd.DataFrame
             CSV data as a dataframe
         """
-        converter = {} if not converter else converter
+        if details["type"] == "param":
+            dtypes = details.get("index_dtypes", {})
+        else:
+            dtypes = {"VALUE": details["dtype"]}
+        # Let the C parser type float and string columns directly. Integer
+        # columns may be written as floats, so check_datatypes casts those.
+        dtype = {
+            column: datatype
+            for column, datatype in dtypes.items()
+            if datatype in ["float", "str"]
+        }
         csv_path = os.path.join(filepath, parameter + ".csv")
         try:
-            df = pd.read_csv(csv_path, converters=converter)
+            # Empty cells and strings such as "NA" stay as text in string
+            # columns instead of becoming NaN
+            columns = pd.read_csv(csv_path, nrows=0).columns
+            na_values = {
+                column: STR_NA_VALUES
+                for column in columns
+                if dtypes.get(column) != "str"
+            }
+            df = pd.read_csv(
+                csv_path,
+                dtype=dtype,
+                keep_default_na=False,
+                na_values=na_values,
+            )
         except pd.errors.EmptyDataError:
             logger.error("No data found in file for %s", parameter)
             expected_columns = details["indices"]
@@ -376,22 +492,27 @@ class ReadDatafile(ReadStrategy):
         -------
         str
         """
-        elements = ""
+        elements = []
 
         for name, attributes in config.items():
             if attributes["type"] == "param":
-                elements += "param {} {};\n".format(
-                    name, "{" + ",".join(attributes["indices"]) + "}"
+                elements.append(
+                    "param {} {};\n".format(
+                        name, "{" + ",".join(attributes["indices"]) + "}"
+                    )
                 )
             elif attributes["type"] == "symbolic":
-                elements += "param {0} symbolic := '{1}' ;\n".format(
-                    name, attributes["default"]
+                elements.append(
+                    "param {0} symbolic := '{1}' ;\n".format(
+                        name, attributes["default"]
+                    )
                 )
             elif attributes["type"] == "set":
-                elements += "set {};\n".format(name)
+                elements.append("set {};\n".format(name))
+        definitions = "".join(elements)
 
-        logger.debug("Amply Elements: %s", elements)
-        return elements
+        logger.debug("Amply Elements: %s", definitions)
+        return definitions
 
     def _convert_amply_to_dataframe(
         self, datafile_parser: Amply, config: Dict
@@ -447,7 +568,7 @@ class ReadDatafile(ReadStrategy):
 
         raw_data = datafile_parser[name].data
         data = self._convert_amply_data_to_list(raw_data)
-        df = pd.DataFrame(data=data, columns=indices)
+        df = pd.DataFrame.from_records(data, columns=indices)
         try:
             return check_datatypes(df, config, name)
         except ValueError as ex:
@@ -456,18 +577,27 @@ class ReadDatafile(ReadStrategy):
             )
             raise ValueError(msg)
 
-    def _convert_amply_data_to_list(self, amply_data: Dict) -> List[List]:
-        """Flattens a dictionary into a list of lists
+    def _convert_amply_data_to_list(self, amply_data: Dict) -> Iterator[List]:
+        """Flattens a dictionary into rows of keys followed by the value
+
+        Rows are yielded lazily so they can be consumed straight into a
+        DataFrame without holding an intermediate list of lists.
 
         Arguments
         ---------
         amply_data: dict
         """
 
-        data = []
-
-        raw_data = flatten(amply_data)
-        for key, value in raw_data.items():
-            data.append(list(key) + [value])
-
-        return data
+        # Depth-first walk with an explicit stack keeps the insertion order
+        stack: List[Tuple[Tuple[Any, ...], Iterator[Tuple[Any, Any]]]] = [
+            ((), iter(amply_data.items()))
+        ]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                if isinstance(value, dict):
+                    stack.append((prefix + (key,), iter(value.items())))
+                    break
+                yield [*prefix, key, value]
+            else:
+                stack.pop()
@@ -1,8 +1,11 @@
 import logging
+import re
 from abc import abstractmethod
 from io import StringIO
 from typing import Any, Dict, TextIO, Tuple, Union
+from xml.etree.ElementTree import iterparse
 
+import numpy as np
 import pandas as pd
 
 from otoole.input import ReadStrategy
@@ -10,6 +13,10 @@ from otoole.results.result_package import ResultsPackage
 
 LOGGER = logging.getLogger(__name__)
 
+VARIABLE_NAME = re.compile(r"^(?P<Variable>[^(]+)(?:\((?P<Index>.*)\))?$")
+HIGHS_COLUMNS = {"Index", "Primal", "Type", "Name"}
+GLPK_NAME = re.compile(r"^(?P<NAME>[^\[]+)\[(?P<INDEX>[^\]]*)\]")
+
 
 class ReadResults(ReadStrategy):
     def read(
@@ -137,31 +144,31 @@ class ReadWideResults(ReadResults):
         results = {}  # type: Dict[str, pd.DataFrame]
         not_found = []
 
+        # Split the solution by variable in a single pass over the data
+        grouped = dict(tuple(data.groupby("Variable", sort=False)))
+
         for name, details in sorted(self.results_config.items()):
-            df_cbc = data[data["Variable"] == name]
+            df_cbc = grouped.get(name)
 
-            if not df_cbc.empty:
+            if df_cbc is not None:
 
-                df = df_cbc.copy()  # setting with copy warning
                 LOGGER.debug("Extracting results for %s", name)
                 indices = details["indices"]  # typing: List
-
-                df[indices] = df["Index"].str.split(",", expand=True)
-
-                types = {index: sets[index]["dtype"] for index in indices}
-                df = df.astype(types)
-
-                df = df.drop(columns=["Variable", "Index"])
-
-                df = df.rename(columns={"Value": "VALUE"})
-
                 columns = indices + ["VALUE"]
 
-                df = df[columns]
+                # Build the long frame directly from the split index columns
+                df = df_cbc["Index"].str.split(",", expand=True)
+                df["VALUE"] = df_cbc["Value"]
+                df.columns = columns
 
                 index = details["indices"].copy()
                 df, index = check_duplicate_index(df, columns, index)
-                results[name] = df.set_index(index)
+
+                types = {
+                    column: sets[original]["dtype"]
+                    for column, original in zip(index, indices)
+                }
+                results[name] = df.astype(types).set_index(index)
             else:
                 not_found.append(name)
 
@@ -203,6 +210,27 @@ def rename_duplicate_column(index: list) -> list:
     return column
 
 
+def _split_names(names: pd.Series) -> pd.DataFrame:
+    """Splits solver names such as ``Name(A,B)`` into ``Variable`` and ``Index``
+
+    Names without parentheses are kept whole as the ``Variable`` and get an
+    empty ``Index``.
+
+    Arguments
+    ---------
+    names : pandas.Series
+        The variable names written by the solver
+
+    Returns
+    -------
+    pandas.DataFrame
+        ``Variable`` and ``Index`` columns aligned with ``names``
+    """
+    df = names.astype(str).str.extract(VARIABLE_NAME, expand=True)
+    df["Index"] = df["Index"].fillna("")
+    return df
+
+
 class ReadCplex(ReadWideResults):
     """Read a CPLEX solution file into memeory"""
 
@@ -214,12 +242,30 @@ class ReadCplex(ReadWideResults):
         user_config : Dict[str, Dict]
         file_path : Union[str, TextIO]
         """
-        df = pd.read_xml(file_path, xpath=".//variable", parser="etree")
-        df[["Variable", "Index"]] = df["name"].str.split("(", expand=True)
-        df["Index"] = df["Index"].str.replace(")", "", regex=False)
+        names = []
+        values = []
+        parents = []  # type: list
+        for event, element in iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                parents.append(element)
+                continue
+            parents.pop()
+            if element.tag == "variable":
+                names.append(element.attrib["name"])
+                values.append(element.attrib["value"])
+            # Detach each parsed element from its parent, where it is the only
+            # remaining child, so the tree never holds more than one branch
+            if parents:
+                parents[-1].remove(element)
+
+        # Convert all values in one call and drop zeros before splitting names
+        value = np.array(values, dtype=np.float64)
+        nonzero = value != 0
+        df = _split_names(pd.Series(names, dtype=object)[nonzero])
+        df["Value"] = value[nonzero]
+        df = df.reset_index(drop=True)
         LOGGER.debug(df)
-        df = df[(df["value"] != 0)].reset_index().rename(columns={"value": "Value"})
-        return df[["Variable", "Index", "Value"]].astype({"Value": float})
+        return df
 
 
 class ReadGurobi(ReadWideResults):
@@ -240,10 +286,12 @@ class ReadGurobi(ReadWideResults):
             names=["Variable", "Value"],
             skiprows=2,
         )  # type: pd.DataFrame
-        df[["Variable", "Index"]] = df["Variable"].str.split("(", expand=True)
-        df["Index"] = df["Index"].str.replace(")", "", regex=False)
+        # Drop zero values before splitting the variable names
+        df = df[df["Value"] != 0].reset_index(drop=True)
+        value = df["Value"]
+        df = _split_names(df["Variable"])
+        df["Value"] = value
         LOGGER.debug(df)
-        df = df[(df["Value"] != 0)].reset_index()
         return df[["Variable", "Index", "Value"]].astype({"Value": float})
 
 
@@ -257,28 +305,27 @@ class ReadCbc(ReadWideResults):
         ---------
         file_path : str
         """
+        # Rows read as ``<number> <name> <value> <dual>``, leaving the last
+        # column empty. Rows of variables out of bounds start with an extra
+        # ``**`` marker, which shifts each of their fields one column right.
         df = pd.read_csv(
             file_path,
             header=None,
-            sep="(",
-            names=["Variable", "indexvalue"],
+            sep=r"\s+",
+            names=["c0", "c1", "c2", "c3", "c4"],
             skiprows=1,
         )  # type: pd.DataFrame
-        if df["Variable"].astype(str).str.contains(r"^\*\*").any():
+        infeasible = df["c0"].astype(str) == "**"
+        if infeasible.any():
             LOGGER.warning(
                 "CBC Solution File contains decision variables out of bounds. "
                 + "You have an infeasible solution"
             )
-        df["Variable"] = (
-            df["Variable"]
-            .astype(str)
-            .str.replace(r"^\*\*", "", regex=True)
-            .str.split(expand=True)[1]
-        )
-        df[["Index", "Value"]] = df["indexvalue"].str.split(expand=True).loc[:, 0:1]
-        df["Index"] = df["Index"].str.replace(")", "", regex=False)
-        df = df.drop(columns=["indexvalue"])
-        return df[["Variable", "Index", "Value"]].astype({"Value": float})
+        name = df["c1"].where(~infeasible, df["c2"]).astype(str)
+        value = df["c2"].where(~infeasible, df["c3"])
+        df = _split_names(name)
+        df["Value"] = value.astype(float)
+        return df[["Variable", "Index", "Value"]]
 
 
 class ReadHighs(ReadWideResults):
@@ -297,29 +344,26 @@ class ReadHighs(ReadWideResults):
             skiprows=1,
             index_col=0,
             dtype=str,
+            usecols=lambda column: column in HIGHS_COLUMNS,
         )
 
         # Type column is not garunteed in the the model output
         # retain conditional as filtering on type is more explicit
         if "Type" in df.columns:
             var_types = ["Continuous", "Integer", "SemiContinuous", "SemiInteger"]
-            df = df[df.Type.isin(var_types)].copy()
+            df = df[df.Type.isin(var_types)]
         else:
             df = df.reset_index()
             row = df[df.Index == "Rows"].index[0]
             df = df.iloc[:row].set_index("Index")
 
-        df.index.name = ""  # remove the name Index, as otoole uses that
-
-        df[["Variable", "Index"]] = df["Name"].str.split("(", expand=True).loc[:, 0:1]
-        df["Index"] = df["Index"].str.replace(")", "", regex=False)
-        df = df[~(df.Primal.astype(float).abs() < 1e-6)]
-        return (
-            df[["Variable", "Index", "Primal"]]
-            .rename(columns={"Primal": "Value"})
-            .reset_index(drop=True)
-            .astype({"Variable": str, "Index": str, "Value": float})
-        )
+        # Drop zero values before splitting the variable names
+        value = df["Primal"].astype(float)
+        nonzero = ~(value.abs() < 1e-6)
+        df = _split_names(df.loc[nonzero, "Name"])
+        df["Value"] = value[nonzero]
+        df = df.reset_index(drop=True)
+        return df.astype({"Variable": str, "Index": str, "Value": float})
 
 
 class ReadGlpk(ReadWideResults):
@@ -408,8 +452,7 @@ class ReadGlpk(ReadWideResults):
 
         df = df[(df["ID"].isin(["i", "j"])) & (df["value"] != "cost")]
 
-        df[["NAME", "INDEX"]] = df["value"].str.split("[", expand=True)
-        df["INDEX"] = df["INDEX"].map(lambda x: x.split("]")[0])
+        df[["NAME", "INDEX"]] = df["value"].str.extract(GLPK_NAME, expand=True)
         df = (
             df[["ID", "NUM", "NAME", "INDEX"]]
             .astype({"ID": str, "NUM": "int64", "NAME": str, "INDEX": str})
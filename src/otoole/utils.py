@@ -1,12 +1,19 @@
 import json
 import logging
 import os
+from copy import deepcopy
+from functools import lru_cache
 from importlib.resources import files
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 from pydantic import ValidationError
-from yaml import SafeLoader, load  # type: ignore
+from yaml import load  # type: ignore
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # type: ignore
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore
 
 from otoole.exceptions import OtooleConfigFileError, OtooleDeprecationError
 from otoole.preprocess.validate_config import (
@@ -37,12 +44,24 @@ def read_packaged_file(filename: str, module_name: Optional[str] = None):
         with open(filename, "r") as open_file:
             contents = _read_file(open_file, ending)
     else:
-        with files(module_name).joinpath(filename).open("r") as open_file:
-            contents = _read_file(open_file, ending)
+        # Callers may modify what they get back, so hand out a copy
+        contents = deepcopy(_read_packaged_resource(filename, module_name))
 
     return contents
 
 
+@lru_cache(maxsize=32)
+def _read_packaged_resource(filename: str, module_name: str):
+    """Reads and parses a file shipped in a package, cached on filename and module
+
+    Packaged resources do not change while the interpreter is running, so
+    each one only needs to be parsed once.
+    """
+    _, ending = os.path.splitext(filename)
+    with files(module_name).joinpath(filename).open("r") as open_file:
+        return _read_file(open_file, ending)
+
+
 def extract_config(
     schema: Dict, default_values: Dict
 ) -> Dict[str, Dict[str, Union[str, List[str]]]]:
@@ -274,13 +293,14 @@ class UniqueKeyLoader(SafeLoader):
     """
 
     def construct_mapping(self, node, deep=False):
-        mapping = []
+        seen = set()
         for key_node, _ in node.value:
             key = self.construct_object(key_node, deep=deep)
-            key = key.upper()
-            if key in mapping:
+            if isinstance(key, str):
+                key = key.upper()
+            if key in seen:
                 raise ValueError(f"{key} -> defined more than once")
-            mapping.append(key)
+            seen.add(key)
         return super().construct_mapping(node, deep)
 
 
@@ -33,7 +33,7 @@ Create a yaml validation config with the following format::
 import logging
 import re
 from collections import defaultdict
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Union
 
 import networkx.algorithms.isolate as isolate
 import pandas as pd
@@ -115,12 +115,13 @@ def compose_multi_expression(resource: List) -> str:
     return "|".join(expressions)
 
 
-def validate(expression: str, name: str) -> bool:
+def validate(expression: Union[str, re.Pattern], name: str) -> bool:
     """Determine if ``name`` matches the ``expression``
 
     Arguments
     ---------
-    expression : str
+    expression : str, re.Pattern
+        A regular expression, or one already compiled with ``re.compile``
     name : str
 
     Returns
@@ -128,16 +129,7 @@ def validate(expression: str, name: str) -> bool:
     bool
     """
     logger.debug("Running validation for %s", name)
-
-    valid = False
-
-    pattern = re.compile(expression)
-
-    if pattern.fullmatch(name):
-        valid = True
-    else:
-        valid = False
-    return valid
+    return re.compile(expression).fullmatch(name) is not None
 
 
 def validate_resource(
@@ -162,7 +154,8 @@ def validate_resource(
 
     logger.debug(schemas)
 
-    expression = compose_multi_expression(schemas)
+    # Compile the expression once for all the names in the resource
+    expression = re.compile(compose_multi_expression(schemas))
     resources = get_packaged_resource(input_data, resource)
 
     valid_names = []
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, TextIO
+from typing import Any, Dict, TextIO
 
 import pandas as pd
 
@@ -9,10 +9,41 @@ from otoole.input import WriteStrategy
 
 logger = logging.getLogger(__name__)
 
+try:
+    import xlsxwriter  # noqa: F401
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+else:
+    EXCEL_ENGINE = "xlsxwriter"
+
 
 class WriteExcel(WriteStrategy):
+    def write(
+        self,
+        inputs: Dict[str, pd.DataFrame],
+        filepath: str,
+        default_values: Dict[str, float],
+        **kwargs,
+    ):
+        # Check the sheet names before the workbook is created on disk
+        for name in inputs:
+            if self.user_config.get(name, {}).get("type") != "set":
+                self._sheet_name(name)
+        super().write(inputs, filepath, default_values, **kwargs)
+
     def _header(self):
-        return pd.ExcelWriter(self.filepath, mode="w")
+        return pd.ExcelWriter(self.filepath, mode="w", engine=EXCEL_ENGINE)
+
+    def _sheet_name(self, parameter_name: str) -> str:
+        """Returns the sheet name of a parameter, raising if Excel would reject it"""
+        try:
+            name = self.user_config[parameter_name]["short_name"]
+        except KeyError:
+            name = parameter_name
+
+        if len(name) > 31:
+            raise OtooleExcelNameLengthError(name=name)
+        return name
 
     def _form_parameter(
         self, df: pd.DataFrame, parameter_name: str, default: float
@@ -49,7 +80,13 @@ class WriteExcel(WriteStrategy):
             values = names[-1]
             logger.debug(f"Rows: {rows}; columns: {columns}; values: {values}")
             logger.debug("dtypes: {}".format(df.dtypes))
-            pivot = df.reset_index().pivot(index=rows, columns=columns, values=values)
+            if list(index_names) == rows + [columns]:
+                # The pivot column is already the last index level
+                pivot = df[values].unstack(level=-1)
+            else:
+                pivot = df.reset_index().pivot(
+                    index=rows, columns=columns, values=values
+                )
         else:
             logger.debug(f"One column for {parameter_name}: {names}")
             pivot = df.copy()
@@ -72,7 +109,7 @@ class WriteExcel(WriteStrategy):
         pd.DataFrame
         """
 
-        indices = self.user_config[parameter_name]["indices"]
+        indices = self.user_config[parameter_name]["indices"].copy()
 
         if "input_data" not in kwargs:
             logger.debug(f"Can not pivot excel template for {parameter_name}")
@@ -97,13 +134,7 @@ class WriteExcel(WriteStrategy):
         default: float,
         **kwargs,
     ):
-        try:
-            name = self.user_config[parameter_name]["short_name"]
-        except KeyError:
-            name = parameter_name
-
-        if len(name) > 31:
-            raise OtooleExcelNameLengthError(name=name)
+        name = self._sheet_name(parameter_name)
 
         if not df.empty:
             df = self._form_parameter(df, parameter_name, default)
@@ -129,8 +160,9 @@ class WriteDatafile(WriteStrategy):
 
     def _form_parameter(self, df: pd.DataFrame, default: float):
 
-        # Don't write out values equal to the default value
-        df = df[df.VALUE != default]
+        # Don't write out values equal to the default value. Masking with the
+        # raw array skips aligning a boolean Series against the index
+        df = df[df["VALUE"].to_numpy() != default]
         return df
 
     def _write_parameter(
@@ -152,16 +184,17 @@ class WriteDatafile(WriteStrategy):
         default : int
         """
 
-        df = self._form_parameter(df, default)
         handle.write("param default {} : {} :=\n".format(default, parameter_name))
-        df.to_csv(
-            path_or_buf=handle,
-            sep=" ",
-            header=False,
-            index=True,
-            float_format="%g",
-            lineterminator="\n",
-        )
+        if not df.empty:
+            df = self._form_parameter(df, default)
+            df.to_csv(
+                path_or_buf=handle,
+                sep=" ",
+                header=False,
+                index=True,
+                float_format="%g",
+                lineterminator="\n",
+            )
         handle.write(";\n")
 
     def _write_set(self, df: pd.DataFrame, set_name, handle: TextIO):
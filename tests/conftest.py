@@ -8,20 +8,25 @@
 """
 
 import os
+from copy import deepcopy
 from typing import Dict
 
 import pandas as pd
 from pytest import fixture
 
+from otoole.read_strategies import ReadDatafile
+from otoole.results.results import ReadCbc, ReadCplex, ReadGurobi
 from otoole.utils import _read_file
+from otoole.write_strategies import WriteDatafile, WriteExcel
 
 
-@fixture
-def user_config() -> Dict:
-    """Reads in an example user config
+@fixture(scope="session")
+def session_user_config() -> Dict:
+    """Reads in an example user config once per test session
 
-    Read in an example user config file which can be passed into all
-    Read and Write strategies for testing
+    Fixtures with a wider than function scope should take a deep copy of
+    this config rather than use it directly, as the Read and Write
+    strategies add entries to the nested dictionaries.
 
     Returns
     -------
@@ -40,6 +45,51 @@ def user_config() -> Dict:
     return config
 
 
+@fixture
+def user_config(session_user_config) -> Dict:
+    """Reads in an example user config
+
+    Read in an example user config file which can be passed into all
+    Read and Write strategies for testing. Each test gets its own deep copy
+    of the config parsed for the session.
+
+    Returns
+    -------
+    Dict
+    """
+    return deepcopy(session_user_config)
+
+
+@fixture(scope="class")
+def cplex_reader(session_user_config):
+    return ReadCplex(deepcopy(session_user_config))
+
+
+@fixture(scope="class")
+def gurobi_reader(session_user_config):
+    return ReadGurobi(deepcopy(session_user_config))
+
+
+@fixture(scope="class")
+def cbc_reader(session_user_config):
+    return ReadCbc(deepcopy(session_user_config))
+
+
+@fixture(scope="class")
+def datafile_reader(session_user_config):
+    return ReadDatafile(user_config=deepcopy(session_user_config))
+
+
+@fixture(scope="class")
+def excel_writer(session_user_config):
+    return WriteExcel(deepcopy(session_user_config))
+
+
+@fixture(scope="class")
+def datafile_writer(session_user_config):
+    return WriteDatafile(deepcopy(session_user_config))
+
+
 @fixture
 def annual_technology_emissions_by_mode():
     df = pd.DataFrame(
@@ -8,6 +8,7 @@ import pandas as pd
 from pytest import raises
 
 from otoole import convert, convert_results, read, read_results, write
+from otoole.convert import _get_user_config, _read_user_config
 from otoole.exceptions import OtooleError
 
 
@@ -52,6 +53,17 @@ class TestRead:
         assert "YEAR" in data
         assert isinstance(defaults, dict)
 
+    def test_read_config_cached(self):
+        """Test the configuration is parsed once and handed out as copies"""
+        config = os.path.join("tests", "fixtures", "config.yaml")
+        _read_user_config.cache_clear()
+        first = _get_user_config(config)
+        first["REGION"]["dtype"] = "changed"
+        second = _get_user_config(config)
+
+        assert _read_user_config.cache_info().hits == 1
+        assert second["REGION"]["dtype"] == "str"
+
 
 class TestWrite:
     """Tests the public api for writing data"""
@@ -114,7 +126,7 @@ class TestConvert:
 
             assert actual[-1] == b"end;\n"
             assert actual[0] == b"# Model file written by *otoole*\n"
-            assert actual[2] == b"09_ROK d_bld_2_coal_products 2017 20.8921\n"
+            assert actual[2] == b"09_ROK d_bld_10_electricity 2017 827.898\n"
             assert actual[8996] == b"param default 1 : DepreciationMethod :=\n"
         finally:
             tmpfile.close()
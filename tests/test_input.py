@@ -367,11 +367,16 @@ class TestReadStrategy:
         (
             "param",
             "CapitalCost",
-            pd.DataFrame(columns=["REGION", "TECHNOLOGY", "YEAR", "VALUE"]).set_index(
-                ["REGION", "TECHNOLOGY", "YEAR"]
-            ),
+            pd.DataFrame(
+                {
+                    "REGION": pd.Series(dtype="str"),
+                    "TECHNOLOGY": pd.Series(dtype="str"),
+                    "YEAR": pd.Series(dtype="int64"),
+                    "VALUE": pd.Series(dtype="float"),
+                }
+            ).set_index(["REGION", "TECHNOLOGY", "YEAR"]),
         ),
-        ("set", "REGION", pd.DataFrame(columns=["VALUE"])),
+        ("set", "REGION", pd.DataFrame({"VALUE": pd.Series(dtype="str")})),
     )
     compare_read_to_expected_data = [
         [["CapitalCost", "DiscountRate", "REGION", "TECHNOLOGY", "YEAR"], False],
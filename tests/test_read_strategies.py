@@ -1,27 +1,52 @@
 import os
-from io import StringIO
-from textwrap import dedent
+import sys
+from copy import deepcopy
+from io import BytesIO, StringIO
+from types import ModuleType, SimpleNamespace
 
+import numpy as np
 import pandas as pd
 from amply import Amply
-from pytest import mark, raises
+from pytest import fixture, mark, raises
 
 from otoole.exceptions import OtooleDeprecationError, OtooleError
 from otoole.preprocess.longify_data import check_datatypes
-from otoole.read_strategies import ReadCsv, ReadDatafile, ReadExcel, ReadMemory
+from otoole.read_strategies import (
+    ReadCsv,
+    ReadDatafile,
+    ReadExcel,
+    ReadMemory,
+    _excel_engine,
+    _read_excel_sheets,
+)
 from otoole.results.results import (
-    ReadCbc,
     ReadCplex,
     ReadGlpk,
     ReadGurobi,
     ReadHighs,
     ReadResults,
+    _split_names,
     check_for_duplicates,
     identify_duplicate,
     rename_duplicate_column,
 )
 from otoole.utils import _read_file
 
+# Column padding of the CBC solution sample
+_SP51 = " " * 51
+_SP23 = " " * 23
+
+
+def _mk_prelim(variables, indices, values) -> pd.DataFrame:
+    """Builds an expected ``Variable``, ``Index``, ``Value`` frame column-wise"""
+    return pd.DataFrame(
+        {
+            "Variable": np.asarray(variables, dtype=object),
+            "Index": np.asarray(indices, dtype=object),
+            "Value": np.asarray(values, dtype=np.float64),
+        }
+    )
+
 
 # To instantiate abstract class ReadResults
 class DummyReadResults(ReadResults):
@@ -29,9 +54,7 @@ class DummyReadResults(ReadResults):
         raise NotImplementedError()
 
 
-class TestReadCplex:
-
-    cplex_data = """<?xml version = "1.0" encoding="UTF-8" standalone="yes"?>
+_CPLEX_BYTES = b"""<?xml version = "1.0" encoding="UTF-8" standalone="yes"?>
 <CPLEXSolution version="1.2">
  <header
    problemName="model.lp"
@@ -83,85 +106,73 @@ class TestReadCplex:
  </objectiveValues>
 </CPLEXSolution>"""
 
-    def test_convert_to_dataframe(self, user_config):
-        input_file = self.cplex_data
-        reader = ReadCplex(user_config)
-        with StringIO(input_file) as file_buffer:
-            actual = reader._convert_to_dataframe(file_buffer)
-        expected = pd.DataFrame(
+
+@fixture(scope="class")
+def cplex_prelim(cplex_reader):
+    with BytesIO(_CPLEX_BYTES) as file_buffer:
+        return cplex_reader._convert_to_dataframe(file_buffer)
+
+
+@fixture(scope="class")
+def cplex_otoole_df():
+    new_capacity = pd.DataFrame(
+        {
+            "REGION": ["SIMPLICITY"] * 2,
+            "TECHNOLOGY": ["ETHPLANT"] * 2,
+            "YEAR": np.array([2015, 2016], dtype="int64"),
+            "VALUE": [0.030000000000000027, 0.030999999999999917],
+        }
+    ).set_index(["REGION", "TECHNOLOGY", "YEAR"])
+    rate_of_activity = pd.DataFrame(
+        {
+            "REGION": ["SIMPLICITY"] * 3,
+            "TIMESLICE": ["ID"] * 3,
+            "TECHNOLOGY": ["HYD1"] * 3,
+            "MODE_OF_OPERATION": np.ones(3, dtype="int64"),
+            "YEAR": np.array([2020, 2021, 2022], dtype="int64"),
+            "VALUE": [0.25228800000000001] * 3,
+        }
+    ).set_index(["REGION", "TIMESLICE", "TECHNOLOGY", "MODE_OF_OPERATION", "YEAR"])
+    return {"NewCapacity": new_capacity, "RateOfActivity": rate_of_activity}
+
+
+class TestReadCplex:
+    def test_convert_to_dataframe(self, cplex_prelim):
+        actual = cplex_prelim
+        expected = _mk_prelim(
+            ["NewCapacity"] * 2 + ["RateOfActivity"] * 3,
             [
-                ["NewCapacity", "SIMPLICITY,ETHPLANT,2015", 0.030000000000000027],
-                ["NewCapacity", "SIMPLICITY,ETHPLANT,2016", 0.030999999999999917],
-                ["RateOfActivity", "SIMPLICITY,ID,HYD1,1,2020", 0.25228800000000001],
-                ["RateOfActivity", "SIMPLICITY,ID,HYD1,1,2021", 0.25228800000000001],
-                ["RateOfActivity", "SIMPLICITY,ID,HYD1,1,2022", 0.25228800000000001],
+                "SIMPLICITY,ETHPLANT,2015",
+                "SIMPLICITY,ETHPLANT,2016",
+                "SIMPLICITY,ID,HYD1,1,2020",
+                "SIMPLICITY,ID,HYD1,1,2021",
+                "SIMPLICITY,ID,HYD1,1,2022",
             ],
-            columns=["Variable", "Index", "Value"],
-        ).astype({"Variable": str, "Index": str, "Value": float})
+            [
+                0.030000000000000027,
+                0.030999999999999917,
+                0.25228800000000001,
+                0.25228800000000001,
+                0.25228800000000001,
+            ],
+        )
 
         pd.testing.assert_frame_equal(actual, expected)
 
-    def test_solution_to_dataframe(self, user_config):
-        input_file = self.cplex_data
+    def test_solution_to_dataframe(self, user_config, cplex_prelim, cplex_otoole_df):
         reader = ReadCplex(user_config)
-        with StringIO(input_file) as file_buffer:
-            actual = reader.read(file_buffer)
-        expected = (
-            pd.DataFrame(
-                [
-                    ["SIMPLICITY", "ETHPLANT", 2015, 0.030000000000000027],
-                    ["SIMPLICITY", "ETHPLANT", 2016, 0.030999999999999917],
-                ],
-                columns=["REGION", "TECHNOLOGY", "YEAR", "VALUE"],
-            )
-            .astype({"REGION": str, "TECHNOLOGY": str, "YEAR": "int64", "VALUE": float})
-            .set_index(["REGION", "TECHNOLOGY", "YEAR"])
-        )
-
-        pd.testing.assert_frame_equal(actual[0]["NewCapacity"], expected)
-
-        expected = (
-            pd.DataFrame(
-                [
-                    ["SIMPLICITY", "ID", "HYD1", 1, 2020, 0.25228800000000001],
-                    ["SIMPLICITY", "ID", "HYD1", 1, 2021, 0.25228800000000001],
-                    ["SIMPLICITY", "ID", "HYD1", 1, 2022, 0.25228800000000001],
-                ],
-                columns=[
-                    "REGION",
-                    "TIMESLICE",
-                    "TECHNOLOGY",
-                    "MODE_OF_OPERATION",
-                    "YEAR",
-                    "VALUE",
-                ],
-            )
-            .astype(
-                {
-                    "REGION": str,
-                    "TIMESLICE": str,
-                    "TECHNOLOGY": str,
-                    "MODE_OF_OPERATION": "int64",
-                    "YEAR": "int64",
-                    "VALUE": float,
-                }
-            )
-            .set_index(
-                ["REGION", "TIMESLICE", "TECHNOLOGY", "MODE_OF_OPERATION", "YEAR"]
-            )
-        )
-        pd.testing.assert_frame_equal(actual[0]["RateOfActivity"], expected)
+        actual = reader._convert_wide_to_long(cplex_prelim)
+        for name in ["NewCapacity", "RateOfActivity"]:
+            pd.testing.assert_frame_equal(actual[name], cplex_otoole_df[name])
 
     def test_solution_to_dataframe_with_defaults(self, user_config):
-        input_file = self.cplex_data
-
         regions = pd.DataFrame(data=["SIMPLICITY"], columns=["VALUE"])
         technologies = pd.DataFrame(data=["ETHPLANT"], columns=["VALUE"])
         years = pd.DataFrame(data=[2014, 2015, 2016], columns=["VALUE"])
         input_data = {"REGION": regions, "TECHNOLOGY": technologies, "YEAR": years}
 
         reader = ReadCplex(user_config, write_defaults=True)
-        with StringIO(input_file) as file_buffer:
+        with BytesIO(_CPLEX_BYTES) as file_buffer:
             actual = reader.read(file_buffer, input_data=input_data)
         expected = (
             pd.DataFrame(
@@ -179,10 +190,7 @@ class TestReadCplex:
         pd.testing.assert_frame_equal(actual[0]["NewCapacity"], expected)
 
 
-class TestReadGurobi:
-
-    gurobi_data = dedent(
-        """# Solution for model cost
+_GUROBI_DATA = """# Solution for model cost
 # Objective value = 4.4973196701520455e+03
 TotalDiscountedCost(SIMPLICITY,2013) 0
 TotalDiscountedCost(SIMPLICITY,2014) 1.9360385416218188e+02
@@ -194,34 +202,46 @@ RateOfActivity(SIMPLICITY,ID,FEL1,1,2015) 1.60167966406719
 RateOfActivity(SIMPLICITY,ID,FEL1,1,2016) 1.6369526094781
 RateOfActivity(SIMPLICITY,ID,FEL1,1,2017) 1.68590281943611
 """
-    )
 
-    def test_convert_to_dataframe(self, user_config):
-        input_file = self.gurobi_data
-        reader = ReadGurobi(user_config)
-        with StringIO(input_file) as file_buffer:
-            actual = reader._convert_to_dataframe(file_buffer)
-        expected = pd.DataFrame(
+
+@fixture(scope="class")
+def gurobi_prelim(gurobi_reader):
+    with StringIO(_GUROBI_DATA) as file_buffer:
+        return gurobi_reader._convert_to_dataframe(file_buffer)
+
+
+class TestReadGurobi:
+    def test_convert_to_dataframe(self, gurobi_prelim):
+        actual = gurobi_prelim
+        expected = _mk_prelim(
+            ["TotalDiscountedCost"] * 4 + ["RateOfActivity"] * 4,
             [
-                ["TotalDiscountedCost", "SIMPLICITY,2014", 1.9360385416218188e02],
-                ["TotalDiscountedCost", "SIMPLICITY,2015", 1.8772386050936669e02],
-                ["TotalDiscountedCost", "SIMPLICITY,2016", 1.8399762956864294e02],
-                ["TotalDiscountedCost", "SIMPLICITY,2017", 1.8172752298186381e02],
-                ["RateOfActivity", "SIMPLICITY,ID,FEL1,1,2014", 1.59376124775045],
-                ["RateOfActivity", "SIMPLICITY,ID,FEL1,1,2015", 1.60167966406719],
-                ["RateOfActivity", "SIMPLICITY,ID,FEL1,1,2016", 1.6369526094781],
-                ["RateOfActivity", "SIMPLICITY,ID,FEL1,1,2017", 1.68590281943611],
+                "SIMPLICITY,2014",
+                "SIMPLICITY,2015",
+                "SIMPLICITY,2016",
+                "SIMPLICITY,2017",
+                "SIMPLICITY,ID,FEL1,1,2014",
+                "SIMPLICITY,ID,FEL1,1,2015",
+                "SIMPLICITY,ID,FEL1,1,2016",
+                "SIMPLICITY,ID,FEL1,1,2017",
             ],
-            columns=["Variable", "Index", "Value"],
-        ).astype({"Variable": str, "Index": str, "Value": float})
+            [
+                1.9360385416218188e02,
+                1.8772386050936669e02,
+                1.8399762956864294e02,
+                1.8172752298186381e02,
+                1.59376124775045,
+                1.60167966406719,
+                1.6369526094781,
+                1.68590281943611,
+            ],
+        )
 
         pd.testing.assert_frame_equal(actual, expected)
 
-    def test_solution_to_dataframe(self, user_config):
-        input_file = self.gurobi_data
+    def test_solution_to_dataframe(self, user_config, gurobi_prelim):
         reader = ReadGurobi(user_config)
-        with StringIO(input_file) as file_buffer:
-            actual = reader.read(file_buffer)
+        actual = reader._convert_wide_to_long(gurobi_prelim)
         expected = (
             pd.DataFrame(
                 [
@@ -236,7 +256,7 @@ RateOfActivity(SIMPLICITY,ID,FEL1,1,2017) 1.68590281943611
             .set_index(["REGION", "YEAR"])
         )
 
-        pd.testing.assert_frame_equal(actual[0]["TotalDiscountedCost"], expected)
+        pd.testing.assert_frame_equal(actual["TotalDiscountedCost"], expected)
 
         expected = (
             pd.DataFrame(
@@ -260,20 +280,104 @@ RateOfActivity(SIMPLICITY,ID,FEL1,1,2017) 1.68590281943611
                 ["REGION", "TIMESLICE", "TECHNOLOGY", "MODE_OF_OPERATION", "YEAR"]
             )
         )
-        pd.testing.assert_frame_equal(actual[0]["RateOfActivity"], expected)
+        pd.testing.assert_frame_equal(actual["RateOfActivity"], expected)
+
+    def test_read(self, user_config):
+        reader = ReadGurobi(user_config)
+        with StringIO(_GUROBI_DATA) as file_buffer:
+            actual, _ = reader.read(file_buffer)
+        expected = (
+            pd.DataFrame(
+                [
+                    ["SIMPLICITY", 2014, 1.9360385416218188e02],
+                    ["SIMPLICITY", 2015, 1.8772386050936669e02],
+                    ["SIMPLICITY", 2016, 1.8399762956864294e02],
+                    ["SIMPLICITY", 2017, 1.8172752298186381e02],
+                ],
+                columns=["REGION", "YEAR", "VALUE"],
+            )
+            .astype({"YEAR": "int64", "VALUE": float})
+            .set_index(["REGION", "YEAR"])
+        )
+
+        pd.testing.assert_frame_equal(actual["TotalDiscountedCost"], expected)
+
+
+_TOTAL_COST_CBC = f"""Optimal - objective value 4483.96932237
+                             1 TotalDiscountedCost(SIMPLICITY,2015){_SP51}187.01576{_SP23}0
+                             2 TotalDiscountedCost(SIMPLICITY,2016){_SP51}183.30788{_SP23}0
+                             3 TotalDiscountedCost(SIMPLICITY,2017){_SP51}181.05465{_SP23}0
+                             4 TotalDiscountedCost(SIMPLICITY,2018){_SP51}218.08923{_SP23}0
+                             5 TotalDiscountedCost(SIMPLICITY,2019){_SP51}193.85792{_SP23}0
+                             6 TotalDiscountedCost(SIMPLICITY,2020){_SP51}233.79202{_SP23}0
+
+"""
+
+
+@fixture(scope="class")
+def cbc_prelim(cbc_reader):
+    with StringIO(_TOTAL_COST_CBC) as file_buffer:
+        return cbc_reader._convert_to_dataframe(file_buffer)
+
+
+@fixture(scope="class")
+def total_cost_cbc_mid():
+    return _mk_prelim(
+        ["TotalDiscountedCost"] * 6,
+        ["SIMPLICITY,{}".format(year) for year in range(2015, 2021)],
+        [187.01576, 183.30788, 181.05465, 218.08923, 193.85792, 233.79202],
+    )
+
+
+@fixture(scope="class")
+def total_cost_otoole_df():
+    return {
+        "TotalDiscountedCost": pd.DataFrame(
+            data=[
+                ["SIMPLICITY", 2015, 187.01576],
+                ["SIMPLICITY", 2016, 183.30788],
+                ["SIMPLICITY", 2017, 181.05465],
+                ["SIMPLICITY", 2018, 218.08923],
+                ["SIMPLICITY", 2019, 193.85792],
+                ["SIMPLICITY", 2020, 233.79202],
+            ],
+            columns=["REGION", "YEAR", "VALUE"],
+        ).set_index(["REGION", "YEAR"])
+    }
+
+
+@fixture(scope="class")
+def annual_emissions_cbc_mid():
+    return _mk_prelim(
+        ["AnnualEmissions"] * 3,
+        ["REGION,CO2,2017", "REGION,CO2,2018", "REGION,CO2,2019"],
+        [137958.8400384134, 305945.3841061913, 626159.9611543404],
+    )
+
+
+@fixture(scope="class")
+def annual_emissions_otoole_df():
+    return {
+        "AnnualEmissions": pd.DataFrame(
+            data=[
+                ["REGION", "CO2", 2017, 137958.8400384134],
+                ["REGION", "CO2", 2018, 305945.3841061913],
+                ["REGION", "CO2", 2019, 626159.9611543404],
+            ],
+            columns=["REGION", "EMISSION", "YEAR", "VALUE"],
+        ).set_index(["REGION", "EMISSION", "YEAR"])
+    }
 
 
 class TestReadCbc:
 
-    cbc_data = dedent(
-        """0 Trade(Globe,Globe,IP,L_AGR,2015) -0.0 0
+    cbc_data = """0 Trade(Globe,Globe,IP,L_AGR,2015) -0.0 0
 0 Trade(Globe,Globe,IP,L_AGR,2016) -1.0 0
 0 Trade(Globe,Globe,IP,L_AGR,2017) -2.0 0
 0 Trade(Globe,Globe,IP,L_AGR,2018) -3.0 0
 0 Trade(Globe,Globe,IP,L_AGR,2019) -4.0 0
 0 Trade(Globe,Globe,IP,L_AGR,2020) -5.0 0
-            """
-    )
+"""
     otoole_data = pd.DataFrame(
         data=[
             ["Globe", "Globe", "IP", "L_AGR", 2016, -1.0],
@@ -293,14 +397,12 @@ class TestReadCbc:
     ]
 
     @mark.parametrize("cbc_input,expected", test_data)
-    def test_read_cbc_to_otoole_dataframe(self, cbc_input, expected, user_config):
+    def test_read_cbc_to_otoole_dataframe(self, cbc_input, expected, cbc_reader):
         with StringIO(cbc_input) as file_buffer:
-            actual = ReadCbc(user_config).read(file_buffer, kwargs={"input_data": {}})[
-                0
-            ]["Trade"]
+            actual = cbc_reader.read(file_buffer, kwargs={"input_data": {}})[0]["Trade"]
         pd.testing.assert_frame_equal(actual, expected)
 
-    def test_read_cbc_dataframe_to_otoole_dataframe(self, user_config):
+    def test_read_cbc_dataframe_to_otoole_dataframe(self, cbc_reader):
 
         prelim_data = pd.DataFrame(
             data=[
@@ -312,28 +414,21 @@ class TestReadCbc:
             ],
             columns=["Variable", "Index", "Value"],
         )
-        actual = ReadCbc(user_config)._convert_wide_to_long(prelim_data)["Trade"]
+        actual = cbc_reader._convert_wide_to_long(prelim_data)["Trade"]
         pd.testing.assert_frame_equal(actual, self.otoole_data)
 
     test_data_4 = [
-        (["REGION", "REGION", "TIMESLICE", "FUEL", "YEAR"], True),
-        (["REGION", "TIMESLICE", "FUEL", "YEAR"], False),
-        ([], False),
+        (["REGION", "REGION", "TIMESLICE", "FUEL", "YEAR"], True, 1),
+        (["REGION", "TIMESLICE", "FUEL", "YEAR"], False, False),
+        (["REGION", "TIMESLICE", "FUEL", "YEAR", "REGION"], True, 4),
+        (["REGION", "FUEL", "FUEL", "REGION"], True, 2),
+        ([], False, False),
     ]
 
-    @mark.parametrize("data,expected", test_data_4)
-    def test_handle_duplicate_indices(self, data, expected):
-        assert check_for_duplicates(data) is expected
-
-    test_data_5 = [
-        (["REGION", "REGION", "TIMESLICE", "FUEL", "YEAR"], 1),
-        (["REGION", "TIMESLICE", "FUEL", "YEAR"], False),
-        ([], False),
-    ]
-
-    @mark.parametrize("data,expected", test_data_5)
-    def test_identify_duplicate(self, data, expected):
-        assert identify_duplicate(data) == expected
+    @mark.parametrize("data,has_duplicate,position", test_data_4)
+    def test_handle_duplicate_indices(self, data, has_duplicate, position):
+        assert check_for_duplicates(data) is has_duplicate
+        assert identify_duplicate(data) == position
 
     def test_rename_duplicate_column(self):
         data = ["REGION", "REGION", "TIMESLICE", "FUEL", "YEAR"]
@@ -341,112 +436,45 @@ class TestReadCbc:
         expected = ["REGION", "_REGION", "TIMESLICE", "FUEL", "YEAR"]
         assert actual == expected
 
-    total_cost_cbc = dedent(
-        """Optimal - objective value 4483.96932237
-                             1 TotalDiscountedCost(SIMPLICITY,2015){0}187.01576{1}0
-                             2 TotalDiscountedCost(SIMPLICITY,2016){0}183.30788{1}0
-                             3 TotalDiscountedCost(SIMPLICITY,2017){0}181.05465{1}0
-                             4 TotalDiscountedCost(SIMPLICITY,2018){0}218.08923{1}0
-                             5 TotalDiscountedCost(SIMPLICITY,2019){0}193.85792{1}0
-                             6 TotalDiscountedCost(SIMPLICITY,2020){0}233.79202{1}0
-
-                         """.format(
-            " " * 51, " " * 23
-        )
-    )
-
-    total_cost_cbc_mid = pd.DataFrame(
-        data=[
-            ["TotalDiscountedCost", "SIMPLICITY,2015", 187.01576],
-            ["TotalDiscountedCost", "SIMPLICITY,2016", 183.30788],
-            ["TotalDiscountedCost", "SIMPLICITY,2017", 181.05465],
-            ["TotalDiscountedCost", "SIMPLICITY,2018", 218.08923],
-            ["TotalDiscountedCost", "SIMPLICITY,2019", 193.85792],
-            ["TotalDiscountedCost", "SIMPLICITY,2020", 233.79202],
-        ],
-        columns=["Variable", "Index", "Value"],
-    )
+    def test_read_cbc_to_dataframe(self, cbc_prelim, total_cost_cbc_mid):
+        pd.testing.assert_frame_equal(cbc_prelim, total_cost_cbc_mid)
 
-    total_cost_otoole_df = {
-        "TotalDiscountedCost": pd.DataFrame(
-            data=[
-                ["SIMPLICITY", 2015, 187.01576],
-                ["SIMPLICITY", 2016, 183.30788],
-                ["SIMPLICITY", 2017, 181.05465],
-                ["SIMPLICITY", 2018, 218.08923],
-                ["SIMPLICITY", 2019, 193.85792],
-                ["SIMPLICITY", 2020, 233.79202],
-            ],
-            columns=["REGION", "YEAR", "VALUE"],
-        ).set_index(["REGION", "YEAR"])
-    }
-
-    test_data = [(total_cost_cbc, total_cost_cbc_mid)]
-
-    @mark.parametrize("cbc_input,expected", test_data, ids=["TotalDiscountedCost"])
-    def test_read_cbc_to_dataframe(self, cbc_input, expected, user_config):
-        cbc_reader = ReadCbc(user_config)
-        with StringIO(cbc_input) as file_buffer:
+    def test_read_cbc_ignores_column_padding(self, cbc_reader, total_cost_cbc_mid):
+        """The parser splits on any run of whitespace, not fixed column widths"""
+        unpadded = "\n".join(
+            " ".join(line.split()) for line in _TOTAL_COST_CBC.splitlines()
+        )
+        with StringIO(unpadded) as file_buffer:
             actual = cbc_reader._convert_to_dataframe(file_buffer)
-        pd.testing.assert_frame_equal(actual, expected)
+        pd.testing.assert_frame_equal(actual, total_cost_cbc_mid)
 
-    test_data_2 = [
-        # First case
-        (total_cost_cbc_mid, total_cost_otoole_df),
-        # Second case
-        (
-            pd.DataFrame(
-                data=[
-                    ["AnnualEmissions", "REGION,CO2,2017", 137958.8400384134],
-                    ["AnnualEmissions", "REGION,CO2,2018", 305945.3841061913],
-                    ["AnnualEmissions", "REGION,CO2,2019", 626159.9611543404],
-                ],
-                columns=["Variable", "Index", "Value"],
-            ),
-            {
-                "AnnualEmissions": pd.DataFrame(
-                    data=[
-                        ["REGION", "CO2", 2017, 137958.8400384134],
-                        ["REGION", "CO2", 2018, 305945.3841061913],
-                        ["REGION", "CO2", 2019, 626159.9611543404],
-                    ],
-                    columns=["REGION", "EMISSION", "YEAR", "VALUE"],
-                ).set_index(["REGION", "EMISSION", "YEAR"])
-            },
-        ),
-    ]  # type: list
-
-    @mark.parametrize(
-        "results,expected",
-        test_data_2,
-        ids=["TotalDiscountedCost", "AnnualEmissions1"],
-    )
-    def test_convert_cbc_to_csv_long(self, results, expected, user_config):
-        cbc_reader = ReadCbc(user_config=user_config)
-        actual = cbc_reader._convert_wide_to_long(results)
+    def test_convert_cbc_to_csv_long(
+        self, cbc_reader, total_cost_cbc_mid, total_cost_otoole_df
+    ):
+        actual = cbc_reader._convert_wide_to_long(total_cost_cbc_mid)
         assert isinstance(actual, dict)
         for name, df in actual.items():
-            pd.testing.assert_frame_equal(df, expected[name])
+            pd.testing.assert_frame_equal(df, total_cost_otoole_df[name])
 
-    test_data_3 = [(total_cost_cbc, {}, total_cost_otoole_df)]  # type: list
-
-    @mark.parametrize(
-        "cbc_solution,input_data,expected",
-        test_data_3,
-        ids=["TotalDiscountedCost"],
-    )
-    def test_convert_cbc_to_csv_long_read(
-        self, cbc_solution, input_data, expected, user_config
+    def test_convert_cbc_to_csv_long_emissions(
+        self, cbc_reader, annual_emissions_cbc_mid, annual_emissions_otoole_df
     ):
-        cbc_reader = ReadCbc(user_config=user_config)
-        with StringIO(cbc_solution) as file_buffer:
-            actual = cbc_reader.read(file_buffer, kwargs={"input_data": input_data})[0][
+        actual = cbc_reader._convert_wide_to_long(annual_emissions_cbc_mid)
+        assert isinstance(actual, dict)
+        for name, df in actual.items():
+            pd.testing.assert_frame_equal(df, annual_emissions_otoole_df[name])
+
+    def test_convert_cbc_to_csv_long_read(self, cbc_reader, total_cost_otoole_df):
+        with StringIO(_TOTAL_COST_CBC) as file_buffer:
+            actual = cbc_reader.read(file_buffer, kwargs={"input_data": {}})[0][
                 "TotalDiscountedCost"
             ]
         assert isinstance(actual, pd.DataFrame)
-        pd.testing.assert_frame_equal(actual, expected["TotalDiscountedCost"])
+        pd.testing.assert_frame_equal(
+            actual, total_cost_otoole_df["TotalDiscountedCost"]
+        )
 
-    def test_calculate_results(self, user_config):
+    def test_calculate_results(self, cbc_reader):
         cbc_results = {
             "RateOfActivity": pd.DataFrame(
                 data=[
@@ -507,23 +535,18 @@ class TestReadCbc:
             columns=["REGION", "EMISSION", "YEAR", "VALUE"],
         ).set_index(["REGION", "EMISSION", "YEAR"])
 
-        cbc_reader = ReadCbc(user_config)
         actual = cbc_reader.calculate_results(cbc_results, input_data)
         assert isinstance(actual, dict)
         pd.testing.assert_frame_equal(actual["AnnualEmissions"], expected)
 
-    def test_solution_to_dataframe(self, user_config):
-        input_file = self.total_cost_cbc
-        reader = ReadCbc(user_config)
-        with StringIO(input_file) as file_buffer:
-            actual = reader.read(file_buffer)
-        expected = self.total_cost_otoole_df
+    def test_solution_to_dataframe(self, cbc_reader, cbc_prelim, total_cost_otoole_df):
+        actual = cbc_reader._convert_wide_to_long(cbc_prelim)
+        expected = total_cost_otoole_df
         pd.testing.assert_frame_equal(
-            actual[0]["TotalDiscountedCost"], expected["TotalDiscountedCost"]
+            actual["TotalDiscountedCost"], expected["TotalDiscountedCost"]
         )
 
-    cbc_infeasible = dedent(
-        """header
+    cbc_infeasible = """header
 381191 RateOfActivity(GLOBAL,S4D24,INRNGIM00,1,2041)                           0             0
 381191 RateOfActivity(GLOBAL,S4D24,INRNGIM00,1,2042)                           -7.7011981e-07             0.024001857
 381192 RateOfActivity(GLOBAL,S1D1,INRNGIM00,1,2043)                            -3.6128354e-06             0.022858911
@@ -534,35 +557,40 @@ class TestReadCbc:
 **  381221 RateOfActivity(GLOBAL,S2D6,INRNGIM00,1,2043)                            -3.1111969e-06             0.022858911
 **  381229 RateOfActivity(GLOBAL,S2D14,INRNGIM00,1,2043)                           -1.3925924e-07             0.010964295
 """
-    )
 
-    def test_manage_infeasible_variables(self, user_config):
+    def test_manage_infeasible_variables(self, cbc_reader):
         input_file = self.cbc_infeasible
-        reader = ReadCbc(user_config)
         with StringIO(input_file) as file_buffer:
-            actual = reader._convert_to_dataframe(file_buffer)
-        expected = pd.DataFrame(
+            actual = cbc_reader._convert_to_dataframe(file_buffer)
+        expected = _mk_prelim(
+            ["RateOfActivity"] * 9,
             [
-                ["RateOfActivity", "GLOBAL,S4D24,INRNGIM00,1,2041", 0],
-                ["RateOfActivity", "GLOBAL,S4D24,INRNGIM00,1,2042", -7.7011981e-07],
-                ["RateOfActivity", "GLOBAL,S1D1,INRNGIM00,1,2043", -3.6128354e-06],
-                ["RateOfActivity", "GLOBAL,S1D8,INRNGIM00,1,2043", -3.1111316e-06],
-                ["RateOfActivity", "GLOBAL,S1D9,INRNGIM00,1,2043", -8.2325306e-07],
-                ["RateOfActivity", "GLOBAL,S1D10,INRNGIM00,1,2043", -3.1112991e-06],
-                ["RateOfActivity", "GLOBAL,S2D3,INRNGIM00,1,2043", -1.6357402e-06],
-                ["RateOfActivity", "GLOBAL,S2D6,INRNGIM00,1,2043", -3.1111969e-06],
-                ["RateOfActivity", "GLOBAL,S2D14,INRNGIM00,1,2043", -1.3925924e-07],
+                "GLOBAL,S4D24,INRNGIM00,1,2041",
+                "GLOBAL,S4D24,INRNGIM00,1,2042",
+                "GLOBAL,S1D1,INRNGIM00,1,2043",
+                "GLOBAL,S1D8,INRNGIM00,1,2043",
+                "GLOBAL,S1D9,INRNGIM00,1,2043",
+                "GLOBAL,S1D10,INRNGIM00,1,2043",
+                "GLOBAL,S2D3,INRNGIM00,1,2043",
+                "GLOBAL,S2D6,INRNGIM00,1,2043",
+                "GLOBAL,S2D14,INRNGIM00,1,2043",
+            ],
+            [
+                0,
+                -7.7011981e-07,
+                -3.6128354e-06,
+                -3.1111316e-06,
+                -8.2325306e-07,
+                -3.1112991e-06,
+                -1.6357402e-06,
+                -3.1111969e-06,
+                -1.3925924e-07,
             ],
-            columns=["Variable", "Index", "Value"],
         )
         pd.testing.assert_frame_equal(actual, expected)
 
 
-class TestReadGlpk:
-    """Use fixtures instead of StringIO due to the use of context managers in the logic"""
-
-    model_data = dedent(
-        """p lp min 12665 9450 82606
+_GLPK_MODEL = """p lp min 12665 9450 82606
 n p osemosys_fast
 n z cost
 i 1 f
@@ -584,10 +612,20 @@ n j 1026 NewCapacity[SIMPLICITY,WINDPOWER,2040]
 n j 1027 RateOfActivity[SIMPLICITY,ID,BACKSTOP1,1,2014]
 n j 1028 RateOfActivity[SIMPLICITY,IN,BACKSTOP1,1,2014]
 """
-    )
 
-    sol_data = dedent(
-        """c Problem:    osemosys_fast
+
+@fixture(scope="class")
+def glpk_reader(session_user_config):
+    with StringIO(_GLPK_MODEL) as file_buffer:
+        return ReadGlpk(
+            user_config=deepcopy(session_user_config), glpk_model=file_buffer
+        )
+
+
+class TestReadGlpk:
+    """Use fixtures instead of StringIO due to the use of context managers in the logic"""
+
+    sol_data = """c Problem:    osemosys_fast
 c Rows:       12665
 c Columns:    9450
 c Non-zeros:  82606
@@ -610,7 +648,6 @@ j 1027 l 0 162679.693161095
 j 1028 l 0 81291.0524314291
 e o f
 """
-    )
 
     expected_solution = pd.DataFrame(
         [
@@ -631,11 +668,8 @@ e o f
         columns=["ID", "NUM", "STATUS", "PRIM", "DUAL"],
     )
 
-    def test_read_model(self, user_config):
-        model_data = self.model_data
-        with StringIO(model_data) as file_buffer:
-            reader = ReadGlpk(user_config=user_config, glpk_model=file_buffer)
-        actual = reader.model
+    def test_read_model(self, glpk_reader):
+        actual = glpk_reader.model
 
         expected = pd.DataFrame(
             [
@@ -657,13 +691,9 @@ e o f
 
         pd.testing.assert_frame_equal(actual, expected)
 
-    def test_read_solution(self, user_config):
-        model_data = self.model_data
-        sol_data = self.sol_data
-        with StringIO(model_data) as file_buffer:
-            reader = ReadGlpk(user_config=user_config, glpk_model=file_buffer)
-        with StringIO(sol_data) as file_buffer:
-            actual_status, actual_data = reader.read_solution(file_buffer)
+    def test_read_solution(self, glpk_reader):
+        with StringIO(self.sol_data) as file_buffer:
+            actual_status, actual_data = glpk_reader.read_solution(file_buffer)
 
         expected_status = {
             "name": "osemosys_fast",
@@ -674,12 +704,8 @@ e o f
 
         pd.testing.assert_frame_equal(actual_data, self.expected_solution)
 
-    def test_merge_model_sol(self, user_config):
-        model_data = self.model_data
-        with StringIO(model_data) as file_buffer:
-            reader = ReadGlpk(user_config=user_config, glpk_model=file_buffer)
-
-        actual = reader._merge_model_sol(self.expected_solution)
+    def test_merge_model_sol(self, glpk_reader):
+        actual = glpk_reader._merge_model_sol(self.expected_solution)
         expected = pd.DataFrame(
             [
                 ["SalvageValueStorage", "SIMPLICITY,DAM,2014", 0],
@@ -696,23 +722,15 @@ e o f
 
         pd.testing.assert_frame_equal(actual, expected)
 
-    def test_convert_to_dataframe(self, user_config):
-        model_data = self.model_data
-        sol_data = self.sol_data
-        with StringIO(model_data) as file_buffer:
-            reader = ReadGlpk(user_config=user_config, glpk_model=file_buffer)
-        with StringIO(sol_data) as file_buffer:
-            reader._convert_to_dataframe(file_buffer)
-
-    def test_convert_to_dataframe_error(self, user_config):
-        model_data = self.model_data
-        with StringIO(model_data) as file_buffer:
-            reader = ReadGlpk(user_config=user_config, glpk_model=file_buffer)
+    def test_convert_to_dataframe(self, glpk_reader):
+        with StringIO(self.sol_data) as file_buffer:
+            glpk_reader._convert_to_dataframe(file_buffer)
 
+    def test_convert_to_dataframe_error(self, glpk_reader):
         sol = pd.DataFrame()
 
         with raises(TypeError):
-            reader._convert_to_dataframe(sol)
+            glpk_reader._convert_to_dataframe(sol)
 
     def test_read_model_error(self, user_config):
         with raises(TypeError):
@@ -722,8 +740,7 @@ e o f
 class TestReadHighs:
     """Tests reading of HiGHS solution file"""
 
-    highs_data_with_type_col = dedent(
-        """Columns
+    highs_data_with_type_col = """Columns
     Index Status        Lower        Upper       Primal         Dual  Type        Name
         0     BS            0          inf      193.604            0  Continuous  TotalDiscountedCost(SIMPLICITY,2014)
         1     BS            0          inf      187.724            0  Continuous  TotalDiscountedCost(SIMPLICITY,2015)
@@ -753,10 +770,8 @@ Model status: Optimal
 
 Objective value: 4497.319670152045
 """
-    )
 
-    highs_data_no_type_col = dedent(
-        """Columns
+    highs_data_no_type_col = """Columns
     Index Status        Lower        Upper       Primal         Dual  Name
         0     BS            0          inf      193.604            0  TotalDiscountedCost(SIMPLICITY,2014)
         1     BS            0          inf      187.724            0  TotalDiscountedCost(SIMPLICITY,2015)
@@ -786,7 +801,6 @@ Model status: Optimal
 
 Objective value: 4497.319670152045
 """
-    )
 
     test_data = [highs_data_with_type_col, highs_data_no_type_col]
 
@@ -854,6 +868,33 @@ Objective value: 4497.319670152045
         )
         pd.testing.assert_frame_equal(actual[0]["RateOfActivity"], expected)
 
+    def test_split_names(self):
+        names = pd.Series(
+            [
+                "TotalDiscountedCost(SIMPLICITY,2014)",
+                "RateOfActivity(R,WN,H,1,2020)",
+            ]
+        )
+        actual = _split_names(names)
+        expected = pd.DataFrame(
+            {
+                "Variable": ["TotalDiscountedCost", "RateOfActivity"],
+                "Index": ["SIMPLICITY,2014", "R,WN,H,1,2020"],
+            }
+        )
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_split_names_without_parentheses(self):
+        names = pd.Series(["TotalDiscountedCost(SIMPLICITY,2014)", "Objective"])
+        actual = _split_names(names)
+        expected = pd.DataFrame(
+            {
+                "Variable": ["TotalDiscountedCost", "Objective"],
+                "Index": ["SIMPLICITY,2014", ""],
+            }
+        )
+        pd.testing.assert_frame_equal(actual, expected)
+
 
 class TestCleanOnRead:
     """Tests that a data is cleaned and indexed upon reading"""
@@ -1006,35 +1047,24 @@ class TestConfig:
         assert actual["AccumulatedAnnualDemand"] == expected
 
 
-class TestReadDatafile:
-    def test_amply(self):
+_VARIABLE_COST_DATA = {
+    "SIMPLICITY": {
+        "ETHPLANT": {1.0: {2014.0: 2.89}, 2.0: {2014.0: 999999.0}},
+        "GAS_EXTRACTION": {1.0: {2014.0: 7.5}, 2.0: {2014.0: 999999.0}},
+    }
+}
 
-        Amply(
-            """set REGION;
-            # set REGION := SIMPLICITY;
-            set TECHNOLOGY;
-            set TECHNOLOGY := ETHPLANT GAS_EXTRACTION;
-            set MODE_OF_OPERATION;
-            set MODE_OF_OPERATION := 1 2;
-            set YEAR;
-            set YEAR := 2014;
-            end;"""
-        )
 
-    def test_convert_amply_to_dataframe(self, user_config):
+class _ParsedDatafile(dict):
+    """Stands in for an Amply parser whose symbols have already been parsed"""
 
-        config = {
-            "VariableCost": {
-                "type": "param",
-                "indices": ["REGION", "TECHNOLOGY", "MODE_OF_OPERATION", "YEAR"],
-                "dtype": "float",
-                "default": 0,
-            },
-            "REGION": {"type": "set", "dtype": "str"},
-            "YEAR": {"dtype": "int", "type": "set"},
-            "MODE_OF_OPERATION": {"dtype": "int", "type": "set"},
-            "TECHNOLOGY": {"dtype": "str", "type": "set"},
-        }
+    @property
+    def symbols(self):
+        return self
+
+
+class TestReadDatafile:
+    def test_amply(self):
 
         amply = Amply(
             """set REGION;
@@ -1049,11 +1079,6 @@ class TestReadDatafile:
         amply.load_string(
             "param VariableCost {REGION,TECHNOLOGY,MODE_OF_OPERATION,YEAR};"
         )
-        #     amply.load_string("""param default 0 : VariableCost :=
-        # SIMPLICITY ETHPLANT 1 2014 2.89
-        # SIMPLICITY ETHPLANT 2 2014 999999.0
-        # SIMPLICITY GAS_EXTRACTION 1 2014 7.5
-        # SIMPLICITY GAS_EXTRACTION 2 2014 999999.0""")
         amply.load_string(
             """
     param VariableCost default 0.0001 :=
@@ -1066,10 +1091,27 @@ class TestReadDatafile:
     1 7.5
     2 999999.0;"""
         )
+        assert amply["VariableCost"].data == _VARIABLE_COST_DATA
 
-        read = ReadDatafile(user_config=user_config)
+    def test_convert_amply_to_dataframe(self, datafile_reader):
+
+        config = {
+            "VariableCost": {
+                "type": "param",
+                "indices": ["REGION", "TECHNOLOGY", "MODE_OF_OPERATION", "YEAR"],
+                "dtype": "float",
+                "default": 0,
+            },
+            "REGION": {"type": "set", "dtype": "str"},
+            "YEAR": {"dtype": "int", "type": "set"},
+            "MODE_OF_OPERATION": {"dtype": "int", "type": "set"},
+            "TECHNOLOGY": {"dtype": "str", "type": "set"},
+        }
 
-        actual = read._convert_amply_to_dataframe(amply, config)
+        # test_amply checks that Amply parses the datafile into this shape
+        parser = _ParsedDatafile(VariableCost=SimpleNamespace(data=_VARIABLE_COST_DATA))
+
+        actual = datafile_reader._convert_amply_to_dataframe(parser, config)
         expected = pd.DataFrame(
             data=[
                 ["SIMPLICITY", "ETHPLANT", 1, 2014, 2.89],
@@ -1081,48 +1123,54 @@ class TestReadDatafile:
         )
         pd.testing.assert_frame_equal(actual["VariableCost"], expected)
 
-    def test_convert_amply_data_to_list_of_lists(self, user_config):
+    def test_convert_amply_data_to_list_of_lists(self, datafile_reader):
 
-        data = {
-            "SIMPLICITY": {
-                "ETHPLANT": {1.0: {2014.0: 2.89}, 2.0: {2014.0: 999999.0}},
-                "GAS_EXTRACTION": {1.0: {2014.0: 7.5}, 2.0: {2014.0: 999999.0}},
-            }
-        }
         expected = [
             ["SIMPLICITY", "ETHPLANT", 1.0, 2014.0, 2.89],
             ["SIMPLICITY", "ETHPLANT", 2.0, 2014.0, 999999.0],
             ["SIMPLICITY", "GAS_EXTRACTION", 1.0, 2014.0, 7.5],
             ["SIMPLICITY", "GAS_EXTRACTION", 2.0, 2014.0, 999999.0],
         ]
-        read = ReadDatafile(user_config=user_config)
-        actual = read._convert_amply_data_to_list(data)
-        assert actual == expected
+        actual = datafile_reader._convert_amply_data_to_list(_VARIABLE_COST_DATA)
+        assert list(actual) == expected
 
-    def test_load_parameters(self, user_config):
+    def test_load_parameters(self, datafile_reader):
 
         config = {"TestParameter": {"type": "param", "indices": ["index1", "index2"]}}
-        read = ReadDatafile(user_config=user_config)
-        actual = read._load_parameter_definitions(config)
+        actual = datafile_reader._load_parameter_definitions(config)
         expected = "param TestParameter {index1,index2};\n"
         assert actual == expected
 
-    def test_load_sets(self, user_config):
+    def test_load_sets(self, datafile_reader):
 
         config = {"TestSet": {"type": "set"}}
 
-        read = ReadDatafile(user_config=user_config)
-        actual = read._load_parameter_definitions(config)
+        actual = datafile_reader._load_parameter_definitions(config)
         expected = "set TestSet;\n"
         assert actual == expected
 
-    def test_catch_error_no_parameter(self, caplog, user_config):
+    def test_load_definitions(self, datafile_reader):
+
+        config = {
+            "REGION": {"type": "set"},
+            "ResultsPath": {"type": "symbolic", "default": "results"},
+            "TestParameter": {"type": "param", "indices": ["REGION"]},
+            "TestResult": {"type": "result", "indices": ["REGION"]},
+        }
+        actual = datafile_reader._load_parameter_definitions(config)
+        expected = (
+            "set REGION;\n"
+            "param ResultsPath symbolic := 'results' ;\n"
+            "param TestParameter {REGION};\n"
+        )
+        assert actual == expected
+
+    def test_catch_error_no_parameter(self, caplog, datafile_reader):
         """Fix for https://github.com/OSeMOSYS/otoole/issues/70 where parameter in
         datafile but not in config causes error.  Instead, throw warning (and advise
         that user should use a custom configuration).
         """
-        read = ReadDatafile(user_config=user_config)
-        config = read.user_config
+        config = datafile_reader.user_config
         amply_datafile = amply = Amply(
             """set REGION;
             set TECHNOLOGY;
@@ -1130,7 +1178,7 @@ class TestReadDatafile:
             set YEAR;"""
         )
         amply.load_string("""param ResultsPath := 'test_path';""")
-        read._convert_amply_to_dataframe(amply_datafile, config)
+        datafile_reader._convert_amply_to_dataframe(amply_datafile, config)
         assert (
             "Parameter ResultsPath could not be found in the configuration."
             in caplog.text
@@ -1153,6 +1201,20 @@ class TestReadDatafile:
 
 
 class TestReadExcel:
+    def test_excel_engine_without_calamine(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "python_calamine", None)
+        assert _excel_engine() == "openpyxl"
+
+    @mark.parametrize(
+        "pandas_version,expected",
+        [("2.1.4", "openpyxl"), ("2.2.0", "calamine"), ("3.0.0", "calamine")],
+    )
+    def test_excel_engine_with_calamine(self, monkeypatch, pandas_version, expected):
+        calamine = ModuleType("python_calamine")
+        monkeypatch.setitem(sys.modules, "python_calamine", calamine)
+        monkeypatch.setattr(pd, "__version__", pandas_version)
+        assert _excel_engine() == expected
+
     def test_read_excel_yearsplit(self, user_config):
         """ """
         spreadsheet = os.path.join("tests", "fixtures", "combined_inputs.xlsx")
@@ -1219,6 +1281,24 @@ class TestReadExcel:
 
         pd.testing.assert_frame_equal(actual["AnnualEmissionLimit"].iloc[:3], expected)
 
+    def test_read_excel_cached(self, user_config):
+        spreadsheet = os.path.join("tests", "fixtures", "combined_inputs.xlsx")
+        _read_excel_sheets.cache_clear()
+        reader = ReadExcel(user_config=user_config)
+        first, _ = reader.read(spreadsheet)
+        second, _ = reader.read(spreadsheet)
+
+        assert _read_excel_sheets.cache_info().hits == 1
+        pd.testing.assert_frame_equal(first["YearSplit"], second["YearSplit"])
+
+    def test_read_excel_cache_holds_one_workbook(self):
+        _read_excel_sheets.cache_clear()
+        for name in ["combined_inputs.xlsx", "simplicity.xlsx"]:
+            spreadsheet = os.path.join("tests", "fixtures", name)
+            _read_excel_sheets(spreadsheet, os.path.getmtime(spreadsheet))
+
+        assert _read_excel_sheets.cache_info().currsize == 1
+
     def test_narrow_parameters(self, user_config):
         data = [
             ["IW0016", 0.238356164, 0.238356164, 0.238356164],
@@ -1280,11 +1360,12 @@ class TestReadExcel:
         reader = ReadExcel(user_config=user_config)
         actual = reader._check_index(df)
         expected = {
-            "YearSplit": pd.DataFrame(
-                data, columns=["TIMESLICE", "YEAR", "VALUE"]
-            ).set_index(["TIMESLICE", "YEAR"])
+            "YearSplit": pd.DataFrame(data, columns=["TIMESLICE", "YEAR", "VALUE"])
+            .set_index(["TIMESLICE", "YEAR"])
+            .sort_index()
         }
         pd.testing.assert_frame_equal(actual["YearSplit"], expected["YearSplit"])
+        assert actual["YearSplit"].index.is_monotonic_increasing
 
 
 class TestReadCSV:
@@ -1301,7 +1382,7 @@ class TestReadCSV:
     )
     availability_factor_df = pd.DataFrame(
         columns=["REGION", "TECHNOLOGY", "YEAR", "VALUE"]
-    )
+    ).astype({"VALUE": float})
 
     test_data = [
         ("AccumulatedAnnualDemand", accumulated_annual_demand_df),
@@ -1317,6 +1398,21 @@ class TestReadCSV:
 
         pd.testing.assert_frame_equal(actual, expected)
 
+    def test_get_input_data_empty_cells(self, user_config, tmp_path):
+        (tmp_path / "AccumulatedAnnualDemand.csv").write_text(
+            "REGION,FUEL,YEAR,VALUE\nNA,,2014,1.0\nSIMPLICITY,ETH,2015,\n"
+        )
+        reader = ReadCsv(user_config=user_config)
+        details = user_config["AccumulatedAnnualDemand"]
+        actual = reader._get_input_data(
+            str(tmp_path), "AccumulatedAnnualDemand", details
+        )
+        expected = pd.DataFrame(
+            [["NA", "", 2014, 1.0], ["SIMPLICITY", "ETH", 2015, np.nan]],
+            columns=["REGION", "FUEL", "YEAR", "VALUE"],
+        )
+        pd.testing.assert_frame_equal(actual, expected)
+
     def test_read_default_values_csv_fails(self, user_config, tmp_path):
         f = tmp_path / "input/default_values.csv"
         f.parent.mkdir()
@@ -1355,30 +1451,71 @@ class TestReadCSV:
 
         pd.testing.assert_frame_equal(actual["CapitalCost"], expected)
 
+    def test_read_csv_year_dtype(self):
+        """YEAR is read as text from csv and cast when the index is checked"""
+        user_config_path = os.path.join(
+            "tests", "fixtures", "super_simple", "super_simple.yaml"
+        )
+        with open(user_config_path, "r") as config_file:
+            user_config = _read_file(config_file, ".yaml")
+
+        filepath = os.path.join("tests", "fixtures", "super_simple", "csv")
+        reader = ReadCsv(user_config=user_config)
+        actual, _ = reader.read(filepath)
+        years = actual["CapitalCost"].index.get_level_values("YEAR")
+        assert years.dtype == "int64"
+
 
 class TestReadTabular:
     """Methods shared for csv and excel"""
 
+    raw = pd.DataFrame(
+        {"REGION": [" SIMPLICITY "], "TECHNOLOGY": ["NGCC  "], "YEAR": [2014]}
+    )
+    stripped = pd.DataFrame(
+        {"REGION": ["SIMPLICITY"], "TECHNOLOGY": ["NGCC"], "YEAR": [2014]}
+    )
+
     test_data = [
-        (True, ["REGION", "TECHNOLOGY"], {}),
-        (
-            False,
-            ["REGION", "TECHNOLOGY"],
-            {"REGION": str.strip, "TECHNOLOGY": str.strip},
-        ),
+        (True, ["REGION", "TECHNOLOGY"], raw),
+        (False, ["REGION", "TECHNOLOGY"], stripped),
+        (False, ["REGION", "TECHNOLOGY", "YEAR", "FUEL"], stripped),
     ]
 
     @mark.parametrize(
         "keep_whitespace, indices, expected",
         test_data,
-        ids=["create_empty", "create_full"],
+        ids=["keep", "strip", "strip_non_string"],
     )
-    def test_whitespace_converter(
-        self, user_config, keep_whitespace, indices, expected
-    ):
+    def test_strip_whitespace(self, user_config, keep_whitespace, indices, expected):
         reader = ReadCsv(user_config=user_config, keep_whitespace=keep_whitespace)
-        actual = reader._whitespace_converter(indices)
-        assert actual == expected
+        actual = reader._strip_whitespace(self.raw.copy(), indices)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_convert_wide_2_narrow_year_dtype(self, user_config):
+        """Integer year headers, as read from Excel, give an int64 YEAR column"""
+        wide = pd.DataFrame(
+            [["SIMPLICITY", "ETH", 1.0, 2.0]],
+            columns=["REGION", "FUEL", 2014, 2015],
+        )
+        reader = ReadCsv(user_config=user_config)
+        actual = reader._convert_wide_2_narrow(wide, "AccumulatedAnnualDemand")
+        expected = pd.DataFrame(
+            {
+                "REGION": ["SIMPLICITY", "SIMPLICITY"],
+                "FUEL": ["ETH", "ETH"],
+                "YEAR": np.array([2014, 2015], dtype="int64"),
+                "VALUE": [1.0, 2.0],
+            }
+        ).set_index(["REGION", "FUEL", "YEAR"])
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_strip_whitespace_string_dtype(self, user_config):
+        reader = ReadCsv(user_config=user_config)
+        raw = self.raw.astype({"REGION": "string", "TECHNOLOGY": "string"})
+        actual = reader._strip_whitespace(raw, ["REGION", "TECHNOLOGY"])
+        expected = self.stripped.astype({"REGION": "string", "TECHNOLOGY": "string"})
+        pd.testing.assert_frame_equal(actual, expected)
 
 
 class TestLongifyData:
@@ -1414,6 +1551,15 @@ class TestLongifyData:
 
         pd.testing.assert_frame_equal(actual, expected)
 
+    def test_check_datatypes_coerce_int(self, user_config):
+        df = self.data_valid.astype({"YEAR": str})
+        actual = check_datatypes(df, user_config, "AvailabilityFactor")
+        expected = self.data_valid.astype(
+            {"REGION": str, "FUEL": str, "YEAR": "int64", "VALUE": float}
+        )
+
+        pd.testing.assert_frame_equal(actual, expected)
+
     def test_check_datatypes_invalid(self, user_config):
         df = self.data_invalid
 
@@ -1428,6 +1574,16 @@ class TestExpandRequiredParameters:
 
     technology = pd.DataFrame(data=["NGCC"], columns=["VALUE"])
 
+    expected_dr = pd.DataFrame(
+        data=[["SIMPLICITY", 0.05]],
+        columns=["REGION", "VALUE"],
+    ).set_index(["REGION"])
+
+    expected_dr_idv = pd.DataFrame(
+        data=[["SIMPLICITY", "NGCC", 0.10]],
+        columns=["REGION", "TECHNOLOGY", "VALUE"],
+    ).set_index(["REGION", "TECHNOLOGY"])
+
     def test_no_expansion(self):
 
         user_config = {
@@ -1466,19 +1622,7 @@ class TestExpandRequiredParameters:
         actual = reader._expand_required_params(input_data, defaults)
 
         actual_dr = actual["DiscountRate"]
-
-        expected_dr = pd.DataFrame(
-            data=[["SIMPLICITY", 0.05]],
-            columns=["REGION", "VALUE"],
-        ).set_index(["REGION"])
-
-        pd.testing.assert_frame_equal(actual_dr, expected_dr)
+        pd.testing.assert_frame_equal(actual_dr, self.expected_dr)
 
         actual_dr_idv = actual["DiscountRateIdv"]
-
-        expected_dr_idv = pd.DataFrame(
-            data=[["SIMPLICITY", "NGCC", 0.10]],
-            columns=["REGION", "TECHNOLOGY", "VALUE"],
-        ).set_index(["REGION", "TECHNOLOGY"])
-
-        pd.testing.assert_frame_equal(actual_dr_idv, expected_dr_idv)
+        pd.testing.assert_frame_equal(actual_dr_idv, self.expected_dr_idv)
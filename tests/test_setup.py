@@ -33,13 +33,11 @@ def test_get_csv_setup_data():
     }
 
     accumulated_annual_demand = pd.DataFrame(
-        columns=["REGION", "FUEL", "YEAR", "VALUE"]
-    ).astype(
         {
-            "REGION": "str",
-            "FUEL": "str",
-            "YEAR": "int64",
-            "VALUE": "float",
+            "REGION": pd.Series(dtype="str"),
+            "FUEL": pd.Series(dtype="str"),
+            "YEAR": pd.Series(dtype="int64"),
+            "VALUE": pd.Series(dtype="float"),
         }
     )
     expected_inputs = {
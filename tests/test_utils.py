@@ -1,5 +1,4 @@
-import os
-from tempfile import NamedTemporaryFile
+from io import BytesIO
 
 import pandas as pd
 import pytest
@@ -8,8 +7,10 @@ import yaml
 from otoole.exceptions import OtooleDeprecationError, OtooleExcelNameLengthError
 from otoole.utils import (
     UniqueKeyLoader,
+    _read_packaged_resource,
     create_name_mappings,
     read_deprecated_datapackage,
+    read_packaged_file,
 )
 from otoole.write_strategies import WriteExcel
 
@@ -78,24 +79,35 @@ user_config_name_errors = ["user_config_long_param_name", "user_config_long_shor
 def test_excel_name_length_error(user_config_simple, request):
     user_config = request.getfixturevalue(user_config_simple)
     write_excel = WriteExcel(user_config=user_config)
-    temp_excel = NamedTemporaryFile(suffix=".xlsx", delete=False, mode="r")
-    try:
-        with pytest.raises(OtooleExcelNameLengthError):
-            write_excel._write_parameter(
-                df=pd.DataFrame(),
-                parameter_name="ParameterNameLongerThanThirtyOneChars",
-                handle=pd.ExcelWriter(temp_excel.name),
-                default=0,
-            )
-    finally:
-        temp_excel.close()
-        os.unlink(temp_excel.name)
+    with pytest.raises(OtooleExcelNameLengthError):
+        write_excel._write_parameter(
+            df=pd.DataFrame(),
+            parameter_name="ParameterNameLongerThanThirtyOneChars",
+            handle=pd.ExcelWriter(BytesIO(), engine="openpyxl"),
+            default=0,
+        )
+
+
+@pytest.mark.parametrize(
+    "user_config_simple",
+    user_config_name_errors,
+    ids=["full_name_error", "short_name_error"],
+)
+def test_excel_name_length_error_before_writing(user_config_simple, request, tmp_path):
+    user_config = request.getfixturevalue(user_config_simple)
+    write_excel = WriteExcel(user_config=user_config)
+    filepath = tmp_path / "output.xlsx"
+    with pytest.raises(OtooleExcelNameLengthError):
+        write_excel.write(
+            {"ParameterNameLongerThanThirtyOneChars": pd.DataFrame()},
+            str(filepath),
+            {},
+        )
+    assert not filepath.exists()
 
 
 class TestYamlUniqueKeyReader:
-    @pytest.fixture()
-    def valid_yaml(self):
-        data = """
+    valid_yaml = """
             Key1:
               data1: valid data
               data2: 123
@@ -103,7 +115,6 @@ class TestYamlUniqueKeyReader:
               data1: valid data
               data2: 123
             """
-        return data
 
     invalid_yaml_1 = """
             Key1:
@@ -123,8 +134,12 @@ class TestYamlUniqueKeyReader:
               data2: 123
             """
 
-    def test_valid_yaml(self, valid_yaml):
-        actual = yaml.load(valid_yaml, Loader=UniqueKeyLoader)
+    def test_non_string_keys(self):
+        actual = yaml.load("2014: a\n2015: b\n", Loader=UniqueKeyLoader)
+        assert actual == {2014: "a", 2015: "b"}
+
+    def test_valid_yaml(self):
+        actual = yaml.load(self.valid_yaml, Loader=UniqueKeyLoader)
         expected = {
             "Key1": {"data1": "valid data", "data2": 123},
             "Key2": {"data1": "valid data", "data2": 123},
@@ -140,19 +155,36 @@ class TestYamlUniqueKeyReader:
             yaml.load(invalid_yaml, Loader=UniqueKeyLoader)
 
 
-def test_successful_read_deprecated_datapackage(tmp_path):
-    f = tmp_path / "input/datapackage.json"
-    f.parent.mkdir()
-    f.touch()
-    csvs = tmp_path / "input/data"
-    csvs.mkdir()
+@pytest.fixture(scope="module")
+def deprecated_datapackage(tmp_path_factory):
+    """Datapackage layouts with and without a data folder in one temporary dir"""
+    root = tmp_path_factory.mktemp("datapackage")
+    for layout in ["with_data", "without_data"]:
+        f = root / layout / "input/datapackage.json"
+        f.parent.mkdir(parents=True)
+        f.touch()
+    (root / "with_data/input/data").mkdir()
+    return root
+
+
+def test_successful_read_deprecated_datapackage(deprecated_datapackage):
+    f = deprecated_datapackage / "with_data/input/datapackage.json"
+    csvs = deprecated_datapackage / "with_data/input/data"
     actual = read_deprecated_datapackage(f)
     assert actual == str(csvs)
 
 
-def test_unsuccessful_read_deprecated_datapackage(tmp_path):
-    f = tmp_path / "input/datapackage.json"
-    f.parent.mkdir()
-    f.touch()
+def test_unsuccessful_read_deprecated_datapackage(deprecated_datapackage):
+    f = deprecated_datapackage / "without_data/input/datapackage.json"
     with pytest.raises(OtooleDeprecationError):
         read_deprecated_datapackage(f)
+
+
+def test_read_packaged_file_cached():
+    """Packaged files are parsed once and each caller receives a copy"""
+    _read_packaged_resource.cache_clear()
+    first = read_packaged_file("config.yaml", "otoole.preprocess")
+    first["REGION"]["dtype"] = "int"
+    second = read_packaged_file("config.yaml", "otoole.preprocess")
+    assert second["REGION"]["dtype"] == "str"
+    assert _read_packaged_resource.cache_info().hits == 1
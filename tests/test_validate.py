@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from yaml import FullLoader, load  # type: ignore
 
@@ -44,6 +46,19 @@ def test_validate_fuel_code_true_multi(name, expected):
     assert actual == expected
 
 
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("DZAETH", True),
+        ("AGOETHETH", False),
+    ],
+)
+def test_validate_compiled_expression(name, expected):
+
+    actual = validate(re.compile("^(DZA|AGO)(ETH|CR1)"), name)
+    assert actual == expected
+
+
 def test_compose_expression():
 
     schema = [
@@ -1,5 +1,3 @@
-import tempfile
-
 import pytest
 
 from otoole.visualise import create_res
@@ -11,7 +9,7 @@ url = "tests/fixtures/simplicity-v0.2.1.zip"
     "pydot deprecated, requires replacement with pygraphviz "
     + "(https://github.com/OSeMOSYS/otoole/issues/121)"
 )
-def test_create_res():
+def test_create_res(tmp_path):
 
-    _, path_to_resfile = tempfile.mkstemp(suffix=".pdf")
+    path_to_resfile = str(tmp_path / "res.pdf")
     create_res(url, path_to_resfile)